@@ -56,6 +56,7 @@ import asyncio
 import time
 import math
 import random
+import itertools
 import re
 import psutil
 from typing import Optional, List, Union, Dict, Any, Tuple
@@ -157,6 +158,10 @@ bot = commands.Bot(command_prefix=COMMAND_PREFIX, intents=intents)
 # ATTACH DATA MANAGER TO BOT - CRITICAL FIX
 bot.data_manager = data_manager
 
+# Running member total across all guilds, seeded in on_ready and kept current
+# by the guild/member join/remove events so the heartbeat never has to re-sum
+bot._total_members = 0
+
 # Then load your extensions...
 
 # Enhanced token validation and import with fallback mechanism
@@ -274,6 +279,9 @@ MOMMY_ERROR_VARIANTS = [
     "😳 Oh goodness, that wasn't supposed to happen! Mommy will do better, sweetheart! ✨"
 ]
 
+# Error replies cycle through a shuffled copy so error paths skip the RNG call
+_ERROR_VARIANT_CYCLE = itertools.cycle(random.sample(MOMMY_ERROR_VARIANTS, len(MOMMY_ERROR_VARIANTS)))
+
 MOMMY_SUCCESS_VARIANTS = [
     "🎉 Yay, Mommy is so proud of you, darling! Fantastic work! 💖",
     "👏 Hooray, you've done it, sweetie! Mommy loves your effort! 🌟",
@@ -1309,7 +1317,7 @@ async def checkvalue_command(ctx, member: Optional[discord.Member] = None):
         logging.error(traceback.format_exc())
         try:
             await ctx.send(
-                f"{random.choice(MOMMY_ERROR_VARIANTS)}\n\n*Error: {str(e)}*"
+                f"{next(_ERROR_VARIANT_CYCLE)}\n\n*Error: {str(e)}*"
             )
         except:
             pass
@@ -1366,7 +1374,7 @@ async def checkgold_command(ctx, member: Optional[discord.Member] = None):
         logging.error(error_msg)
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(f"{random.choice(MOMMY_ERROR_VARIANTS)}\n\n*Error: {str(e)}*")
+            await ctx.send(f"{next(_ERROR_VARIANT_CYCLE)}\n\n*Error: {str(e)}*")
         except:
             pass
 
@@ -1550,7 +1558,7 @@ async def confess_command(ctx):
             # Use embed for errors too
             error_embed = discord.Embed(
                 title="❌ Oh no!",
-                description=random.choice(MOMMY_ERROR_VARIANTS),
+                description=next(_ERROR_VARIANT_CYCLE),
                 color=discord.Color.red()
             )
             error_embed.set_footer(text=f"Error details: {str(e)[:100]}")
@@ -1559,7 +1567,7 @@ async def confess_command(ctx):
             logging.error(f"Failed to send error message: {send_error}")
             # Last resort plain text
             try:
-                await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+                await ctx.send(next(_ERROR_VARIANT_CYCLE))
             except:
                 pass
 
@@ -1605,7 +1613,7 @@ async def shopping_command(ctx):
             # Enhanced error handling with embed
             error_embed = discord.Embed(
                 title="❌ Shopping Error",
-                description=random.choice(MOMMY_ERROR_VARIANTS),
+                description=next(_ERROR_VARIANT_CYCLE),
                 color=discord.Color.red()
             )
             error_embed.set_footer(text=f"Error details: {str(e)[:100]}")
@@ -1614,7 +1622,7 @@ async def shopping_command(ctx):
             logging.error(f"Failed to send error message: {send_error}")
             # Last resort plain text
             try:
-                await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+                await ctx.send(next(_ERROR_VARIANT_CYCLE))
             except:
                 pass
 @bot.command(hidden=True)
@@ -1671,7 +1679,7 @@ async def spill_command(ctx):
             # Enhanced error handling with embed
             error_embed = discord.Embed(
                 title="❌ Gossip Error",
-                description=random.choice(MOMMY_ERROR_VARIANTS),
+                description=next(_ERROR_VARIANT_CYCLE),
                 color=discord.Color.red()
             )
             error_embed.set_footer(text=f"Error details: {str(e)[:100]}")
@@ -1680,7 +1688,7 @@ async def spill_command(ctx):
             logging.error(f"Failed to send error message: {send_error}")
             # Last resort plain text
             try:
-                await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+                await ctx.send(next(_ERROR_VARIANT_CYCLE))
             except:
                 pass
 
@@ -1726,7 +1734,7 @@ async def tipjar_command(ctx):
             # Enhanced error handling with embed
             error_embed = discord.Embed(
                 title="❌ Tipjar Error",
-                description=random.choice(MOMMY_ERROR_VARIANTS),
+                description=next(_ERROR_VARIANT_CYCLE),
                 color=discord.Color.red()
             )
             error_embed.set_footer(text=f"Error details: {str(e)[:100]}")
@@ -1735,7 +1743,7 @@ async def tipjar_command(ctx):
             logging.error(f"Failed to send error message: {send_error}")
             # Last resort plain text
             try:
-                await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+                await ctx.send(next(_ERROR_VARIANT_CYCLE))
             except:
                 pass
 
@@ -1884,7 +1892,7 @@ async def mommy_command(ctx):
         logging.error(f"Error in mommy command: {e}")
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+            await ctx.send(next(_ERROR_VARIANT_CYCLE))
         except:
             pass
 
@@ -2034,7 +2042,7 @@ async def headpat_command(ctx):
         logging.error(f"Error in headpat command: {e}")
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+            await ctx.send(next(_ERROR_VARIANT_CYCLE))
         except:
             pass
 
@@ -2138,7 +2146,7 @@ async def eval_command(ctx, member: Optional[discord.Member] = None):
         logging.error(f"Error in eval command: {e}")
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+            await ctx.send(next(_ERROR_VARIANT_CYCLE))
         except:
             pass
 
@@ -2219,7 +2227,7 @@ async def activity_command(ctx, member: Optional[discord.Member] = None):
         logging.error(f"Error in activity command: {e}")
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+            await ctx.send(next(_ERROR_VARIANT_CYCLE))
         except:
             pass
 
@@ -2466,7 +2474,7 @@ async def sm_command(ctx, *, message=None):
         logging.error(f"Error in sm command: {e}")
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+            await ctx.send(next(_ERROR_VARIANT_CYCLE))
         except:
             pass
 
@@ -2582,7 +2590,7 @@ async def addvalue_command(ctx, *, args=""):
         logging.error(error_msg)
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(f"{random.choice(MOMMY_ERROR_VARIANTS)}\n\n*Error: {str(e)}*")
+            await ctx.send(f"{next(_ERROR_VARIANT_CYCLE)}\n\n*Error: {str(e)}*")
         except:
             pass
 
@@ -2761,7 +2769,7 @@ async def addgold_command(ctx, *, args=""):
         logging.error(error_msg)
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(f"{random.choice(MOMMY_ERROR_VARIANTS)}\n\n*Error: {str(e)}*")
+            await ctx.send(f"{next(_ERROR_VARIANT_CYCLE)}\n\n*Error: {str(e)}*")
         except:
             pass
 
@@ -2820,7 +2828,7 @@ async def reset_command(ctx, member: Optional[discord.Member] = None):
         logging.error(error_msg)
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(f"{random.choice(MOMMY_ERROR_VARIANTS)}\n\n*Error: {str(e)}*")
+            await ctx.send(f"{next(_ERROR_VARIANT_CYCLE)}\n\n*Error: {str(e)}*")
         except:
             pass
 
@@ -2917,7 +2925,7 @@ async def resetall_command(ctx):
         logging.error(error_msg)
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(f"{random.choice(MOMMY_ERROR_VARIANTS)}\n\n*Error: {str(e)}*")
+            await ctx.send(f"{next(_ERROR_VARIANT_CYCLE)}\n\n*Error: {str(e)}*")
         except:
             pass
 
@@ -3124,7 +3132,7 @@ async def rankings_command(ctx):
         logging.error(f"Error in rankings command: {e}")
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(f"{random.choice(MOMMY_ERROR_VARIANTS)}\n\n*Error: {str(e)}*")
+            await ctx.send(f"{next(_ERROR_VARIANT_CYCLE)}\n\n*Error: {str(e)}*")
         except:
             pass
 
@@ -3247,8 +3255,7 @@ class TryoutsView(discord.ui.View):
         except asyncio.TimeoutError:
             await interaction.user.send("The evaluation timed out. Please start again with the !tryoutsresults command.")
             # Remove from active evaluations
-            if eval_id in active_evaluations:
-                del active_evaluations[eval_id]
+            active_evaluations.pop(eval_id, None)
     
     async def ask_gk_ratings(self, interaction):
         """Ask ratings specifically for goalkeepers"""
@@ -3299,8 +3306,7 @@ class TryoutsView(discord.ui.View):
         except asyncio.TimeoutError:
             await interaction.user.send("The evaluation timed out. Please start again with the !tryoutsresults command.")
             # Remove from active evaluations
-            if eval_id in active_evaluations:
-                del active_evaluations[eval_id]
+            active_evaluations.pop(eval_id, None)
     
     async def validate_rating(self, user, rating_str):
         """Validate and normalize rating input"""
@@ -3516,8 +3522,7 @@ class TryoutsView(discord.ui.View):
             await self.ctx.send(f"There was an issue posting the evaluation results for {self.player.mention}. Please try again.")
         
         # Remove from active evaluations
-        if eval_id in active_evaluations:
-            del active_evaluations[eval_id]
+        active_evaluations.pop(eval_id, None)
     
     def disable_all_items(self):
         """Disable all items in the view"""
@@ -3784,7 +3789,7 @@ async def tryouts_results_command(ctx, member: Optional[discord.Member] = None,
     if not hasattr(bot, "_processed_commands"):
         bot._processed_commands = {}
     # Mark this message as processed to avoid duplicates - IMPORTANT: do this EARLY
-    bot._processed_commands[message_id] = time.time()
+    bot._processed_commands[message_id] = {'timestamp': time.time(), 'pid': os.getpid()}
     
     # We already checked for mentions above, no need to do it again
         
@@ -3951,14 +3956,13 @@ async def tryouts_results_command(ctx, member: Optional[discord.Member] = None,
         except discord.Forbidden:
             await ctx.send("I can't send you a DM! Please make sure your privacy settings allow direct messages from server members.")
             # Clean up since we couldn't start the evaluation
-            if eval_id in active_evaluations:
-                del active_evaluations[eval_id]
+            active_evaluations.pop(eval_id, None)
         
     except Exception as e:
         logging.error(f"Error in tryoutsresults command: {e}")
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(f"{random.choice(MOMMY_ERROR_VARIANTS)}\n\n*Error: {str(e)}*")
+            await ctx.send(f"{next(_ERROR_VARIANT_CYCLE)}\n\n*Error: {str(e)}*")
         except:
             pass
 
@@ -4025,7 +4029,7 @@ async def untimeout_command(ctx, member: Optional[discord.Member] = None):
         logging.error(f"Error in untimeout command: {e}")
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(f"{random.choice(MOMMY_ERROR_VARIANTS)}\n\n*Error: {str(e)}*")
+            await ctx.send(f"{next(_ERROR_VARIANT_CYCLE)}\n\n*Error: {str(e)}*")
         except:
             pass
 
@@ -4042,7 +4046,7 @@ async def spank_command(ctx, member: Optional[discord.Member] = None):
     if not hasattr(bot, "_processed_commands"):
         bot._processed_commands = {}
     # Mark this message as processed to avoid duplicates - IMPORTANT: do this EARLY
-    bot._processed_commands[message_id] = time.time()
+    bot._processed_commands[message_id] = {'timestamp': time.time(), 'pid': os.getpid()}
         
     try:
         # Check if user has permission (specific role required)
@@ -4105,7 +4109,7 @@ async def spank_command(ctx, member: Optional[discord.Member] = None):
         logging.error(f"Error in spank command: {e}")
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+            await ctx.send(next(_ERROR_VARIANT_CYCLE))
         except:
             pass
 
@@ -5334,7 +5338,7 @@ async def mr_command(ctx):
     if not hasattr(bot, "_processed_commands"):
         bot._processed_commands = {}
     # Mark this message as processed to avoid duplicates - IMPORTANT: do this EARLY
-    bot._processed_commands[message_id] = time.time()
+    bot._processed_commands[message_id] = {'timestamp': time.time(), 'pid': os.getpid()}
     
     try:
         # Send initial DM to the user asking for match results
@@ -5431,7 +5435,7 @@ async def mr_command(ctx):
         logging.error(f"Error in mr command: {e}")
         logging.error(traceback.format_exc())
         try:
-            await ctx.send(random.choice(MOMMY_ERROR_VARIANTS))
+            await ctx.send(next(_ERROR_VARIANT_CYCLE))
         except:
             pass
 
@@ -5448,7 +5452,7 @@ async def modhelp_command(ctx):
     if not hasattr(bot, "_processed_commands"):
         bot._processed_commands = {}
     # Mark this message as processed to avoid duplicates - IMPORTANT: do this EARLY
-    bot._processed_commands[message_id] = time.time()
+    bot._processed_commands[message_id] = {'timestamp': time.time(), 'pid': os.getpid()}
     
     try:
         # Check if user has appropriate permissions
@@ -5488,7 +5492,7 @@ async def modhelp_command(ctx):
         
     except Exception as e:
         # Handle any exceptions
-        error_message = random.choice(MOMMY_ERROR_VARIANTS)
+        error_message = next(_ERROR_VARIANT_CYCLE)
         await ctx.send(f"{error_message}\n\n```{str(e)}```")
         logging.error(f"Error in modhelp command: {e}", exc_info=True)
 
@@ -6349,8 +6353,7 @@ async def on_message(message):
                                 await message.channel.send("❌ Oh dear, something unexpected happened! Mommy apologizes for the trouble! 🌈")
                                 logging.error(f"Unexpected error when sending server message: {e}", exc_info=True)
                             finally:
-                                if message.author.id in active_server_messages:
-                                    del active_server_messages[message.author.id]
+                                active_server_messages.pop(message.author.id, None)
                         elif content.lower() == "edit":
                             msg_state["step"] = "message_input"
                             await message.channel.send("💫 Let's revise that message, darling! Please type your new message now:")
@@ -6362,16 +6365,15 @@ async def on_message(message):
                     return
                 except Exception as e:
                     logging.error(f"Error processing server message: {e}", exc_info=True)
-                    await message.channel.send(random.choice(MOMMY_ERROR_VARIANTS))
-                    if message.author.id in active_server_messages:
-                        del active_server_messages[message.author.id]
+                    await message.channel.send(next(_ERROR_VARIANT_CYCLE))
+                    active_server_messages.pop(message.author.id, None)
             elif message.author.id in active_matches:
                 try:
                     match_state = active_matches[message.author.id]
                     await process_match_creation_step(match_state, message)
                 except Exception as e:
                     logging.error(f"Error processing match creation step: {e}", exc_info=True)
-                    await message.channel.send(random.choice(MOMMY_ERROR_VARIANTS))
+                    await message.channel.send(next(_ERROR_VARIANT_CYCLE))
             elif message.author.id in active_tryouts:
                 try:
                     player = active_tryouts[message.author.id]["member"]
@@ -6538,7 +6540,7 @@ async def on_message(message):
                                     logging.warning(f"[TRYOUTS] Failed to send DM to player {member_id}: {e}")
                             else:
                                 logging.info(f"[TRYOUTS] Skipped sending completion DM to player {member_id} (tryout initiated via command)")
-                            del active_tryouts[message.author.id]
+                            active_tryouts.pop(message.author.id, None)
                             await message.channel.send(
                                 "✅ **Evaluation Complete!**\n\n"
                                 f"Mommy has posted the results in the tryouts channel and set {player.mention}'s value to ¥{value} million!\n\n"
@@ -6547,7 +6549,7 @@ async def on_message(message):
                             return
                 except Exception as e:
                     logging.error(f"Error processing tryout evaluation step: {e}", exc_info=True)
-                    await message.channel.send(random.choice(MOMMY_ERROR_VARIANTS))
+                    await message.channel.send(next(_ERROR_VARIANT_CYCLE))
         message_details = f"ID:{message.id}, Content:'{message.content[:30]}...', From:{message.author.name}"
         current_pid = os.getpid()
         if not hasattr(bot, "_processed_commands"):
@@ -6556,14 +6558,10 @@ async def on_message(message):
         message_id_str = str(message.id)
         if message_id_str in bot._processed_commands:
             processed_data = bot._processed_commands[message_id_str]
-            # Handle both formats: timestamp (float) or dictionary
-            if isinstance(processed_data, dict):
-                time_ago = time.time() - processed_data.get('timestamp', 0)
-                original_pid = processed_data.get('pid', 'unknown')
-            else:
-                # If it's just a timestamp (float)
-                time_ago = time.time() - processed_data
-                original_pid = "unknown"
+            # Entries are always dicts: every writer stores this shape and
+            # legacy floats are migrated in on_ready
+            time_ago = time.time() - processed_data['timestamp']
+            original_pid = processed_data['pid']
             
             # Check if this is a rankings command - always allow these through
             if is_command and message.content.lower().strip().startswith("!ranking"):
@@ -6583,29 +6581,21 @@ async def on_message(message):
             'is_command': is_command
         }
         logging.info(f"[PROCESSING] {message_details} with PID {current_pid}")
-        try:
-            # Removed duplicate process_commands call - we already do this in the main on_message handler
-            # This prevents double command processing
-            if len(bot._processed_commands) > 1000:
-                cutoff_time = time.time() - 3600
-                keys_to_delete = []
-                for msg_id, data in bot._processed_commands.items():
-                    if isinstance(data, dict):
-                        msg_time = data.get('timestamp', 0)
-                    else:
-                        # If it's just a timestamp (float)
-                        msg_time = data
-                    
-                    if msg_time < cutoff_time:
-                        keys_to_delete.append(msg_id)
-                        
-                for key in keys_to_delete:
-                    del bot._processed_commands[key]
-                    
-                if keys_to_delete:
-                    logging.debug(f"Cleaned up {len(keys_to_delete)} old command entries (older than 1 hour)")
-        except Exception as e:
-            logging.error(f"Error processing message: {e}", exc_info=True)
+        # Removed duplicate process_commands call - we already do this in the main on_message handler
+        # This prevents double command processing
+        if len(bot._processed_commands) > 1000:
+            cutoff_time = time.time() - 3600
+            before = len(bot._processed_commands)
+            # Single pass: keep only entries newer than the cutoff. A stray
+            # float entry must not make the trim fail, or the tracker would
+            # grow without bound, so both shapes are read here
+            bot._processed_commands = {
+                msg_id: data for msg_id, data in bot._processed_commands.items()
+                if (data['timestamp'] if isinstance(data, dict) else data) >= cutoff_time
+            }
+            removed = before - len(bot._processed_commands)
+            if removed:
+                logging.debug(f"Cleaned up {removed} old command entries (older than 1 hour)")
     except Exception as e:
         logging.error(f"Error in on_message event: {e}", exc_info=True)
 
@@ -6614,6 +6604,7 @@ async def on_member_join(member):
     """Handles new member joins with animated welcome and interactive onboarding"""
     global last_heartbeat
     last_heartbeat = time.time()
+    bot._total_members += 1
     try:
         from server_config import get_new_member_role_id, get_server_config, get_channel_id, get_role_id, get_server_name
         import server_walkthrough  # Import our new walkthrough module
@@ -6711,7 +6702,7 @@ async def on_member_join(member):
                         embed.set_thumbnail(url=member.avatar.url)
                     
                     # Add footer with timestamp
-                    embed.set_footer(text=f"Member #{len(member.guild.members)}")
+                    embed.set_footer(text=f"Member #{member.guild.member_count}")
                     embed.timestamp = datetime.now()
                     
                     await welcome_channel.send(content=f"🎉 {member.mention} has joined!", embed=embed)
@@ -6741,6 +6732,21 @@ async def on_member_join(member):
     except Exception as e:
         logging.error(f"Error in on_member_join: {e}", exc_info=True)
 
+@bot.event
+async def on_member_remove(member):
+    """Keep the running member total in sync when someone leaves"""
+    bot._total_members -= 1
+
+@bot.event
+async def on_guild_join(guild):
+    """Add a newly joined guild's members to the running total"""
+    bot._total_members += guild.member_count or 0
+
+@bot.event
+async def on_guild_remove(guild):
+    """Drop a departed guild's members from the running total"""
+    bot._total_members -= guild.member_count or 0
+
 # Note: The nuke command has been completely removed as requested.
 
 # -----------------------------
@@ -6763,7 +6769,7 @@ async def update_heartbeat():
         
         # Update some stats
         guild_count = len(bot.guilds)
-        member_count = sum(g.member_count for g in bot.guilds)
+        member_count = bot._total_members
         
         # Add custom data
         hb.add_custom_data("guild_count", guild_count)
@@ -6781,7 +6787,18 @@ async def update_heartbeat():
 async def on_ready():
     """Called when the bot successfully connects to Discord"""
     logging.info(f"Bot is ready! Logged in as {bot.user.name} ({bot.user.id})")
-    logging.info(f"Connected to {len(bot.guilds)} guilds with {sum(g.member_count for g in bot.guilds)} members")
+
+    # Seed the running member total once; join/remove events keep it current
+    bot._total_members = sum(g.member_count or 0 for g in bot.guilds)
+    logging.info(f"Connected to {len(bot.guilds)} guilds with {bot._total_members} members")
+
+    # Migrate any legacy float-only tracker entries to the dict format once,
+    # so on_message can read them without type-checking every duplicate
+    processed = getattr(bot, "_processed_commands", None)
+    if processed:
+        for msg_id, data in processed.items():
+            if not isinstance(data, dict):
+                processed[msg_id] = {"timestamp": data, "pid": "unknown"}
 
     # Start the heartbeat system
     heartbeat = heartbeat_manager.get_heartbeat_manager("discord_bot")
@@ -6810,12 +6827,24 @@ async def on_ready():
         "db_check.py",
     )
 
-    for cog in cog_list:
-        try:
-            await bot.load_extension(cog)
+    # data_manager has to finish loading before anything else touches it
+    first, *rest = cog_list
+    try:
+        await bot.load_extension(first)
+        logging.info(f"✅ Loaded {first}")
+    except Exception as e:
+        logging.error(f"⚠️ Failed to load {first}: {e}")
+
+    # The remaining cogs are independent, so load them concurrently
+    results = await asyncio.gather(
+        *(bot.load_extension(cog) for cog in rest),
+        return_exceptions=True,
+    )
+    for cog, result in zip(rest, results):
+        if isinstance(result, BaseException):
+            logging.error(f"⚠️ Failed to load {cog}: {result}")
+        else:
             logging.info(f"✅ Loaded {cog}")
-        except Exception as e:
-            logging.error(f"⚠️ Failed to load {cog}: {e}")
 
     # Safe-shutdown hook (flush JSON etc. on SIGTERM/SIGINT if you use it)
     _install_shutdown_handler(bot.loop)
@@ -24,6 +24,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger("BOT_PATCH")
 
+# Patterns are compiled once and reused for every file we patch
+IMPORT_PATTERN = re.compile(r'^import\s+.*$', re.MULTILINE)
+ON_READY_PATTERN = re.compile(r'async\s+def\s+on_ready\s*\(\s*\)\s*:(?:\s*\"\"\".*?\"\"\"\s*)?', re.DOTALL)
+
 def backup_file(file_path):
     """Create a backup of the file"""
     try:
@@ -44,13 +48,11 @@ def insert_heartbeat_import(content):
             logger.info("Heartbeat import already exists")
             return content
             
-        # Find a good place to insert the import
-        import_pattern = re.compile(r'^import\s+.*$', re.MULTILINE)
-        
-        # Find the last import statement
-        matches = list(import_pattern.finditer(content))
-        if matches:
-            last_import = matches[-1]
+        # Find the last import statement, keeping only the latest match
+        last_import = None
+        for last_import in IMPORT_PATTERN.finditer(content):
+            pass
+        if last_import:
             last_import_end = last_import.end()
             
             # Insert after the last import
@@ -86,8 +88,7 @@ def insert_heartbeat_start(content):
             return content
             
         # Find the on_ready function
-        on_ready_pattern = re.compile(r'async\s+def\s+on_ready\s*\(\s*\)\s*:(?:\s*\"\"\".*?\"\"\"\s*)?', re.DOTALL)
-        match = on_ready_pattern.search(content)
+        match = ON_READY_PATTERN.search(content)
         
         if match:
             # Find the end of the on_ready function definition
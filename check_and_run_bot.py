@@ -15,6 +15,7 @@ import json
 import asyncio
 import traceback
 import requests
+import psutil
 from typing import Dict, Any, Optional, Tuple
 
 # Configure logging
@@ -28,22 +29,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Where the launched bot's stdout/stderr go
+BOT_OUTPUT_LOG = "run_bot_output.log"
+
+# Shared HTTP session so repeated checks reuse keep-alive connections
+# instead of paying a fresh TCP+TLS handshake every time
+http_session = requests.Session()
+
+# Reuse the last Discord connectivity result for this many seconds
+CONNECTION_CHECK_TTL = 30
+_last_connection_check: Tuple[float, bool, str] = (0.0, False, "")
+
 def check_discord_connection() -> Tuple[bool, str]:
     """Check Discord connection by actually hitting their API"""
+    global _last_connection_check
+    checked_at, connected, message = _last_connection_check
+    if time.time() - checked_at < CONNECTION_CHECK_TTL:
+        return connected, message
+    
     try:
         # Use requests to check discord.com connectivity
-        response = requests.get("https://discord.com/api/v10/gateway", timeout=5)
+        response = http_session.get("https://discord.com/api/v10/gateway", timeout=5)
         if response.status_code == 200:
-            return True, "Discord API gateway is accessible"
+            result = (True, "Discord API gateway is accessible")
         else:
-            return False, f"Discord API returned status code {response.status_code}"
+            result = (False, f"Discord API returned status code {response.status_code}")
     except requests.RequestException as e:
-        return False, f"Could not connect to Discord API: {e}"
+        result = (False, f"Could not connect to Discord API: {e}")
+    
+    _last_connection_check = (time.time(), *result)
+    return result
 
 def check_bot_health() -> Dict[str, Any]:
     """Check health of the bot via its API"""
     try:
-        response = requests.get("http://localhost:5001/healthz", timeout=2)
+        response = http_session.get("http://localhost:5001/healthz", timeout=2)
         if response.status_code == 200:
             try:
                 return response.json()
@@ -57,18 +77,18 @@ def check_bot_health() -> Dict[str, Any]:
 def check_bot_processes() -> bool:
     """Check if any Discord bot processes are already running"""
     try:
-        result = subprocess.run(
-            ["ps", "-ef"], 
-            capture_output=True, 
-            text=True
-        )
-        
-        if "python" in result.stdout and "bot.py" in result.stdout:
-            logger.info("Found existing bot.py process")
-            return True
-        if "python" in result.stdout and "run_bot.py" in result.stdout:
-            logger.info("Found existing run_bot.py process")
-            return True
+        for proc in psutil.process_iter(['pid', 'cmdline']):
+            try:
+                cmdline = proc.info['cmdline'] or []
+                # Match script names exactly so e.g. this check_and_run_bot.py
+                # process doesn't count as a running bot
+                for arg in cmdline[1:]:
+                    script = os.path.basename(arg)
+                    if script in ("bot.py", "run_bot.py"):
+                        logger.info(f"Found existing {script} process (PID {proc.info['pid']})")
+                        return True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
             
         logger.info("No existing bot processes found")
         return False
@@ -108,12 +128,16 @@ def run_bot_safe() -> int:
         logger.info("Starting Discord bot with safe approach...")
         print("▶ Starting Discord bot with safe approach...")
         
-        bot_process = subprocess.Popen(
-            ["python", "run_bot.py"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+        # Send the bot's output to a log file rather than pipes we never drain,
+        # which would eventually fill up and block a long-running bot
+        log_start = os.path.getsize(BOT_OUTPUT_LOG) if os.path.exists(BOT_OUTPUT_LOG) else 0
+        with open(BOT_OUTPUT_LOG, "a") as log_file:
+            bot_process = subprocess.Popen(
+                ["python", "run_bot.py"],
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                text=True
+            )
         
         # Give it some time to start
         time.sleep(5)
@@ -124,12 +148,16 @@ def run_bot_safe() -> int:
             print("✓ Bot started successfully")
             return 0
         else:
-            stdout, stderr = bot_process.communicate()
+            # Only read back what this run wrote to the log
+            with open(BOT_OUTPUT_LOG, "r", errors="replace") as log_file:
+                log_file.seek(log_start)
+                output = log_file.read()
             logger.error(f"Bot process terminated with exit code {bot_process.returncode}")
-            logger.error(f"Stdout: {stdout}")
-            logger.error(f"Stderr: {stderr}")
+            logger.error(f"Output: {output}")
             print(f"✗ Bot process terminated with exit code {bot_process.returncode}")
-            print(f"Error: {stderr.splitlines()[0] if stderr else 'Unknown error'}")
+            lines = output.strip().splitlines()
+            print(f"Error: {lines[-1] if lines else 'Unknown error'}")
+            print(f"See {BOT_OUTPUT_LOG} for full output")
             return 1
     except Exception as e:
         logger.critical(f"Error starting bot: {e}")
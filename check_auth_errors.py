@@ -9,10 +9,12 @@ It's meant to be run periodically by bulletproof.sh.
 
 import os
 import re
+import json
 import sys
 import time
 import logging
 import subprocess
+from collections import Counter
 from datetime import datetime, timedelta
 
 # Configure logging
@@ -36,6 +38,10 @@ AUTH_ERROR_PATTERNS = [
     r"Token authentication failed"
 ]
 
+# All patterns combined into one alternation so each log is scanned once;
+# the matching group's index tells us which pattern was hit
+AUTH_ERROR_RE = re.compile("|".join(f"({pattern})" for pattern in AUTH_ERROR_PATTERNS))
+
 # Log files to check
 LOG_FILES = [
     "bot_errors.log",
@@ -46,61 +52,145 @@ LOG_FILES = [
     "ultimate_recovery.log"
 ]
 
+# Written by token_refresher.py while it runs
+REFRESHER_PID_FILE = "token_refresher.pid"
+
+# Remembers (mtime, size, failures) per log so unchanged files aren't rescanned
+SCAN_CACHE_FILE = "auth_checker_cache.json"
+
+def load_scan_cache():
+    """Load the per-log scan cache, or an empty one if it's missing or unreadable"""
+    try:
+        with open(SCAN_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_scan_cache(cache):
+    """Write the scan cache atomically so a crash can't leave it half-written"""
+    tmp_path = f"{SCAN_CACHE_FILE}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, SCAN_CACHE_FILE)
+    except OSError as e:
+        logger.error(f"Error saving scan cache: {e}")
+
+def tail_lines(path, n_lines=200, block_size=8192):
+    """Return the last n_lines of a file by reading backwards from the end"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        offset = os.fstat(fd).st_size
+        data = bytearray()
+        # Stop once we have one more newline than needed so the first
+        # line we keep is complete
+        while offset > 0 and data.count(b"\n") <= n_lines:
+            read_size = min(block_size, offset)
+            offset -= read_size
+            data[:0] = os.pread(fd, read_size, offset)
+    finally:
+        os.close(fd)
+    
+    lines = bytes(data).splitlines(keepends=True)[-n_lines:]
+    return b"".join(lines).decode("utf-8", errors="replace")
+
+def stat_log_files():
+    """Stat the existing log files, listing each directory once instead of
+    probing every path with exists() followed by stat()"""
+    wanted = set(LOG_FILES)
+    stats = {}
+    for directory in {os.path.dirname(path) or "." for path in LOG_FILES}:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    path = entry.name if directory == "." else os.path.join(directory, entry.name)
+                    if path in wanted:
+                        stats[path] = entry.stat()
+        except OSError:
+            # Directory (e.g. logs/) doesn't exist - none of its files do either
+            continue
+    return stats
+
 def check_for_auth_failures():
     """Check log files for recent authentication failures"""
     auth_failures = []
+    cache = load_scan_cache()
+    log_stats = stat_log_files()
     
     for log_file in LOG_FILES:
-        if not os.path.exists(log_file):
+        st = log_stats.get(log_file)
+        if st is None:
             continue
             
         try:
             # Get the file modification time
-            mtime = os.path.getmtime(log_file)
-            file_age_minutes = (time.time() - mtime) / 60
+            file_age_minutes = (time.time() - st.st_mtime) / 60
             
             # Only check files that have been modified in the last 10 minutes
             if file_age_minutes > 10:
                 continue
+            
+            # Unchanged since the last run - reuse what we found then
+            cached = cache.get(log_file)
+            if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+                auth_failures.extend(cached[2])
+                continue
                 
             # Read the last 200 lines of the log file
-            try:
-                result = subprocess.run(
-                    ["tail", "-200", log_file],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
+            log_content = tail_lines(log_file, 200)
+            
+            # Check for auth error patterns in a single pass. Most logs are
+            # clean, so a search that stops at the first hit decides whether
+            # it's worth counting matches at all
+            file_failures = []
+            first_match = AUTH_ERROR_RE.search(log_content)
+            if first_match:
+                counts = Counter(
+                    m.lastindex for m in AUTH_ERROR_RE.finditer(log_content, first_match.start())
                 )
-                log_content = result.stdout
-            except:
-                # If tail fails, try to read the file directly
-                with open(log_file, 'r') as f:
-                    log_content = ''.join(f.readlines()[-200:])
+                for index, pattern in enumerate(AUTH_ERROR_PATTERNS, start=1):
+                    if counts[index]:
+                        file_failures.append(f"Found {counts[index]} auth errors in {log_file}: {pattern}")
             
-            # Check for auth error patterns
-            for pattern in AUTH_ERROR_PATTERNS:
-                matches = re.findall(pattern, log_content)
-                if matches:
-                    auth_failures.append(f"Found {len(matches)} auth errors in {log_file}: {pattern}")
+            cache[log_file] = [st.st_mtime, st.st_size, file_failures]
+            auth_failures.extend(file_failures)
         except Exception as e:
             logger.error(f"Error checking {log_file}: {e}")
     
+    save_scan_cache(cache)
     return auth_failures
 
 def is_refresher_running():
     """Check if token_refresher.py is already running"""
+    # Fast path: the refresher records its PID while it runs. A crash can
+    # leave the file behind and the PID may since belong to something else,
+    # so the process must still be token_refresher.py
     try:
-        result = subprocess.run(
-            ["ps", "-ef"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        # Look for token_refresher.py in the process list
-        if "token_refresher.py" in result.stdout:
-            logger.info("Token refresher is already running")
-            return True
+        with open(REFRESHER_PID_FILE, 'r') as f:
+            pid = int(f.read().strip())
+        os.kill(pid, 0)
+        with open(f"/proc/{pid}/cmdline", 'rb') as f:
+            if b"token_refresher.py" in f.read():
+                logger.info("Token refresher is already running")
+                return True
+    except (OSError, ValueError):
+        # Missing/stale PID file - fall back to walking /proc
+        pass
+    
+    try:
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f"/proc/{pid}/cmdline", 'rb') as f:
+                    cmdline = f.read()
+            except OSError:
+                continue
+            
+            # Look for token_refresher.py in the process's arguments
+            if b"token_refresher.py" in cmdline:
+                logger.info("Token refresher is already running")
+                return True
     except Exception as e:
         logger.error(f"Error checking if refresher is running: {e}")
     
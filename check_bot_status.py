@@ -5,28 +5,45 @@ Discord Bot Status Checker
 This script checks the status of various components and helps diagnose issues.
 """
 
+import io
 import os
+import re
 import sys
-import logging
-import asyncio
 import json
-import requests
-import psutil
 import time
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+# Discord bot token: base64 user ID, timestamp and HMAC parts joined by dots
+TOKEN_PATTERN = re.compile(r"[MNO][A-Za-z0-9_-]{23,27}\.[A-Za-z0-9_-]{6,7}\.[A-Za-z0-9_-]{27,}")
+
+# Shared keep-alive session for the localhost endpoint checks, created on
+# first use so importing a single check doesn't pull in requests
+_http_session = None
+
+def get_http_session():
+    """Return the shared session, capped to a small connection pool."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _http_session = requests.Session()
+        _http_session.headers.update({"Connection": "keep-alive"})
+        _http_session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+    return _http_session
+
+# Banner rules are built once and reused for every header
+SECTION_BAR = "=" * 50
+BANNER_BAR = "#" * 80
 
 def print_section(title):
     """Print a section header."""
-    print("\n" + "=" * 50)
-    print(f" {title} ".center(50, "="))
-    print("=" * 50)
+    sys.stdout.write(f"\n{SECTION_BAR}\n{f' {title} '.center(50, '=')}\n{SECTION_BAR}\n")
+
+def print_banner(title, trailing=""):
+    """Print a full-width banner for the start/end of the diagnostics."""
+    sys.stdout.write(f"\n{BANNER_BAR}\n{f' {title} '.center(80, '#')}\n{BANNER_BAR}\n{trailing}")
 
 def check_token():
     """Check if the Discord token is present and valid format."""
@@ -41,8 +58,8 @@ def check_token():
         print(f"   Format: {token_prefix}...{token_suffix}")
         
         # Check format
-        if token.startswith("MTM") and len(token) > 50:
-            print("✅ Token appears to have correct format (starts with MT and length >50)")
+        if TOKEN_PATTERN.fullmatch(token):
+            print("✅ Token appears to have correct format (three dot-separated base64 parts)")
         else:
             print("⚠️ Token may have unusual format, check if it's valid")
     else:
@@ -52,9 +69,10 @@ def check_token():
     if os.path.exists('.env'):
         print("✅ .env file exists")
         try:
-            with open('.env', 'r') as f:
-                env_content = f.read()
-            if 'DISCORD_TOKEN' in env_content:
+            # Scan raw bytes of the first 64 KiB; no need to decode the file
+            with open('.env', 'rb') as f:
+                env_head = f.read(65536)
+            if b'DISCORD_TOKEN=' in env_head:
                 print("✅ DISCORD_TOKEN appears in .env file")
             else:
                 print("❌ DISCORD_TOKEN not found in .env file")
@@ -82,6 +100,7 @@ def check_token():
 def check_event_loop():
     """Check the event loop status."""
     print_section("Event Loop Status")
+    import asyncio
     
     try:
         loop = asyncio.get_event_loop()
@@ -103,17 +122,18 @@ def check_event_loop():
 def check_http_endpoints():
     """Check if HTTP endpoints are responding."""
     print_section("Web Endpoints Check")
+    http_session = get_http_session()
     
     # Check main website
     try:
-        response = requests.get("http://localhost:5000", timeout=2)
+        response = http_session.get("http://localhost:5000", timeout=2)
         print(f"✅ Main website (port 5000) status: {response.status_code}")
     except Exception as e:
         print(f"❌ Main website (port 5000) not responding: {e}")
         
     # Check bot health endpoint
     try:
-        response = requests.get("http://localhost:5001/healthz", timeout=2)
+        response = http_session.get("http://localhost:5001/healthz", timeout=2)
         print(f"✅ Bot health endpoint (port 5001) status: {response.status_code}")
         try:
             data = response.json()
@@ -130,17 +150,20 @@ def check_http_endpoints():
 def check_processes():
     """Check running python processes."""
     print_section("Running Processes")
+    import psutil
     
     bot_processes = []
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+    # Only ask psutil for cmdline; the interpreter name comes from cmdline[0]
+    # so we don't also read each process's stat file
+    for proc in psutil.process_iter(['pid', 'cmdline']):
         try:
-            if proc.info['name'] == 'python' or proc.info['name'] == 'python3':
-                cmdline = proc.info['cmdline']
-                if cmdline and len(cmdline) > 1:
-                    if 'bot.py' in cmdline[1] or 'start_fixed_bot.py' in cmdline[1]:
-                        bot_processes.append(proc)
-                        print(f"✅ Bot process found: PID {proc.pid}, Command: {' '.join(cmdline)}")
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            cmdline = proc.info['cmdline']
+            if (cmdline and len(cmdline) > 1
+                    and os.path.basename(cmdline[0]) in ('python', 'python3')
+                    and ('bot.py' in cmdline[1] or 'start_fixed_bot.py' in cmdline[1])):
+                bot_processes.append(proc)
+                print(f"✅ Bot process found: PID {proc.info['pid']}, Command: {' '.join(cmdline)}")
+        except psutil.Error:
             pass
     
     if not bot_processes:
@@ -164,31 +187,78 @@ def check_files():
     ]
     
     for file_path, description in key_files:
-        if os.path.exists(file_path):
-            size = os.path.getsize(file_path)
-            mtime = os.path.getmtime(file_path)
-            mtime_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))
-            print(f"✅ {file_path:<25} | {size:>8} bytes | {mtime_str} | {description}")
-        else:
+        # One stat per file gives us existence, size and mtime together
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             print(f"❌ {file_path:<25} | {'MISSING':>8} | {'N/A':>19} | {description}")
+            continue
+        mtime_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(st.st_mtime))
+        print(f"✅ {file_path:<25} | {st.st_size:>8} bytes | {mtime_str} | {description}")
+
+class ThreadOutput:
+    """Stand-in for sys.stdout that sends each thread's writes to its own buffer."""
+    
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.local = threading.local()
+    
+    def write(self, text):
+        return getattr(self.local, "buffer", self.fallback).write(text)
+    
+    def flush(self):
+        getattr(self.local, "buffer", self.fallback).flush()
+
+def run_captured(output, check):
+    """Run a check with its printed output collected into a string.
+    
+    A check that raises keeps whatever it printed, followed by its
+    traceback, so one failure doesn't lose the other checks' output."""
+    buffer = output.local.buffer = io.StringIO()
+    try:
+        check()
+    except Exception:
+        buffer.write(f"❌ {check.__name__} failed:\n")
+        traceback.print_exc(file=buffer)
+    finally:
+        del output.local.buffer
+    return buffer.getvalue()
+
+def run_checks():
+    """Run the independent checks concurrently and print their output in order."""
+    output = ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            token_future = pool.submit(run_captured, output, check_token)
+            http_future = pool.submit(run_captured, output, check_http_endpoints)
+            processes_future = pool.submit(run_captured, output, check_processes)
+            files_future = pool.submit(run_captured, output, check_files)
+            # The event loop check inspects the calling thread's loop, so it
+            # has to stay on the main thread
+            event_loop_output = run_captured(output, check_event_loop)
+            
+            sections = [
+                token_future.result(),
+                event_loop_output,
+                http_future.result(),
+                processes_future.result(),
+                files_future.result(),
+            ]
+    finally:
+        sys.stdout = output.fallback
+    
+    print("".join(sections), end="")
 
 def main():
     """Run all checks."""
     try:
-        print("\n" + "#" * 80)
-        print(" Discord Bot Diagnostic Tool ".center(80, "#"))
-        print("#" * 80)
+        print_banner("Discord Bot Diagnostic Tool")
         
         # Run all checks
-        check_token()
-        check_event_loop()
-        check_http_endpoints()
-        check_processes()
-        check_files()
+        run_checks()
         
-        print("\n" + "#" * 80)
-        print(" Diagnostic Complete ".center(80, "#"))
-        print("#" * 80 + "\n")
+        print_banner("Diagnostic Complete", trailing="\n")
     except Exception as e:
         print(f"Error during diagnostics: {e}")
         traceback.print_exc()
@@ -1,12 +1,20 @@
 import discord
+import functools
 import inspect
 
+
+@functools.lru_cache(maxsize=None)
+def get_signature(fn):
+    """Build a function's signature once and reuse it on later lookups"""
+    return inspect.signature(fn)
+
+
 print(f"Discord.py version: {discord.__version__}")
 try:
     from discord.ext import commands
-    print(f"Bot.run signature: {inspect.signature(commands.Bot.run)}")
+    print(f"Bot.run signature: {get_signature(commands.Bot.run)}")
 except (ImportError, AttributeError) as e:
     print(f"Error inspecting Bot.run: {e}")
-    
-# Check client.run signature instead
-print(f"Client.run signature: {inspect.signature(discord.Client.run)}")
\ No newline at end of file
+
+# Check client.run signature instead (Bot inherits run, so this is a cache hit)
+print(f"Client.run signature: {get_signature(discord.Client.run)}")
@@ -1,10 +1,9 @@
 """
 Check what Discord servers the bot is currently connected to
 """
-import asyncio
+import json
 import logging
-import discord
-from discord.ext import commands
+import http.client
 import config
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -12,30 +11,48 @@ logger = logging.getLogger(__name__)
 
 TOKEN = config.get_token()
 
-async def check_guilds():
+GUILDS_PAGE_SIZE = 200  # the most /users/@me/guilds returns per call
+
+def check_guilds():
     """Check what guilds (servers) the bot is connected to"""
-    intents = discord.Intents.default()
-    bot = commands.Bot(command_prefix="!", intents=intents)
-    
-    @bot.event
-    async def on_ready():
-        logger.info(f"Bot connected as {bot.user.name}#{bot.user.discriminator} (ID: {bot.user.id})")
-        logger.info(f"Connected to {len(bot.guilds)} servers:")
-        
-        for guild in bot.guilds:
-            logger.info(f"- {guild.name} (ID: {guild.id})")
-            
-            # Check if this has "king" in the name (case insensitive)
-            if "king" in guild.name.lower():
-                logger.info(f"  *** This server has 'king' in the name! ***")
-        
-        # Once we've logged the guilds, disconnect
-        await bot.close()
-    
+    # REST calls list the bot's guilds; no gateway connection needed. The
+    # endpoint is paged, so keep asking after the last ID until a short page
+    headers = {
+        "Authorization": f"Bot {TOKEN}",
+        "User-Agent": "DiscordBot (https://github.com/discord/discord-api-docs, 1.0.0)"
+    }
+    guilds = []
     try:
-        await bot.start(TOKEN)
+        conn = http.client.HTTPSConnection("discord.com")
+        try:
+            while True:
+                path = f"/api/v10/users/@me/guilds?limit={GUILDS_PAGE_SIZE}"
+                if guilds:
+                    path += f"&after={guilds[-1]['id']}"
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                if response.status != 200:
+                    logger.error(f"Error fetching guilds: Status {response.status}, Message: {data[:200]!r}")
+                    return
+                page = json.loads(data)
+                guilds.extend(page)
+                if len(page) < GUILDS_PAGE_SIZE:
+                    break
+        finally:
+            conn.close()
     except Exception as e:
         logger.error(f"Error connecting to Discord: {e}")
+        return
+
+    logger.info(f"Connected to {len(guilds)} servers:")
+
+    for guild in guilds:
+        logger.info(f"- {guild['name']} (ID: {guild['id']})")
+
+        # Check if this has "king" in the name (case insensitive)
+        if "king" in guild['name'].lower():
+            logger.info(f"  *** This server has 'king' in the name! ***")
 
 if __name__ == "__main__":
-    asyncio.run(check_guilds())
\ No newline at end of file
+    check_guilds()
@@ -6,6 +6,8 @@ This script is very basic, using only standard libraries.
 import os
 import json
 import sys
+import time
+import argparse
 import http.client
 import logging
 from dotenv import load_dotenv
@@ -14,50 +16,97 @@ from dotenv import load_dotenv
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
+# Load environment variables, only parsing .env if the token isn't already set
+if not os.environ.get("DISCORD_TOKEN"):
+    load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 
-def check_token():
-    """Check if token is valid by making a simple API request"""
+HEADERS = {
+    "User-Agent": "DiscordBot (https://github.com/discord/discord-api-docs, 1.0.0)",
+    "Connection": "keep-alive",
+    # The response is tiny; skip any compression round-trip
+    "Accept-Encoding": "identity"
+}
+
+def check_token(conn=None):
+    """Check if token is valid by making a simple API request.
+    
+    Pass an open HTTPSConnection to reuse it (and its TLS session) across
+    checks; otherwise a one-off connection is opened and closed.
+    """
     if not TOKEN:
         logger.error("No Discord token found in environment variables")
         return False
     
+    own_conn = conn is None
     try:
         # Connect to Discord API
-        conn = http.client.HTTPSConnection("discord.com")
-        headers = {
-            "Authorization": f"Bot {TOKEN}",
-            "User-Agent": "DiscordBot (https://github.com/discord/discord-api-docs, 1.0.0)"
-        }
+        if own_conn:
+            conn = http.client.HTTPSConnection("discord.com")
+        headers = dict(HEADERS, Authorization=f"Bot {TOKEN}")
         
         # Make a request to get current user (bot) information
         conn.request("GET", "/api/v10/users/@me", headers=headers)
         response = conn.getresponse()
         
-        # Read response
+        # Read response (always drain it so a kept-alive connection is reusable)
         data = response.read()
-        conn.close()
+        if own_conn:
+            conn.close()
         
+        # The status code alone decides validity; the body is only parsed
+        # for the log details and a bad body mustn't fail the check
         if response.status == 200:
-            bot_info = json.loads(data)
-            logger.info(f"Token is valid for bot: {bot_info.get('username')}#{bot_info.get('discriminator')}")
-            logger.info(f"Bot ID: {bot_info.get('id')}")
+            try:
+                bot_info = json.loads(data)
+                logger.info(f"Token is valid for bot: {bot_info.get('username')}#{bot_info.get('discriminator')}")
+                logger.info(f"Bot ID: {bot_info.get('id')}")
+            except ValueError:
+                logger.info("Token is valid (could not parse bot details)")
             return True
         else:
-            error_data = json.loads(data)
+            try:
+                error_data = json.loads(data)
+            except ValueError:
+                error_data = data[:200]
             logger.error(f"Invalid token: Status {response.status}, Message: {error_data}")
             return False
             
     except Exception as e:
         logger.error(f"Error checking token: {e}")
+        if conn is not None:
+            # Drop the broken connection; http.client reconnects on next request
+            conn.close()
         return False
 
+def run_keepalive(interval):
+    """Check the token every `interval` seconds over one long-lived connection"""
+    conn = http.client.HTTPSConnection("discord.com")
+    logger.info(f"Checking token every {interval}s over a persistent connection")
+    try:
+        while True:
+            check_token(conn)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        logger.info("Stopped keepalive token checks")
+    finally:
+        conn.close()
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check if the Discord token is valid")
+    parser.add_argument("--keepalive", action="store_true",
+                        help="Keep checking on a persistent connection instead of exiting")
+    parser.add_argument("--interval", type=int, default=300,
+                        help="Seconds between checks in --keepalive mode")
+    args = parser.parse_args()
+    
+    if args.keepalive:
+        run_keepalive(args.interval)
+        sys.exit(0)
+    
     if check_token():
         print("✅ Discord token is valid")
         sys.exit(0)
     else:
         print("❌ Discord token is invalid")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -1,5 +1,6 @@
 from __future__ import annotations
-import discord, logging, asyncio, random
+import discord, logging, asyncio, random, functools
+from collections import OrderedDict
 from discord.ext import commands
 import data_manager  # uses async ledger backend now
 
@@ -13,11 +14,17 @@ CH_5V5 = 1351037705961607168
 MOD_CH = 1351221346192982046
 PING_ROLE_ID = 1437677085026943058
 AUTO_CLOSE_H = 4  # hours
+MAX_ACTIVE_BOARDS = 256  # oldest ads get closed past this
 
 # ------------- constants ----------
 REGIONS = ["NA", "EU"]
 MODES = ["1v1", "2v2", "3v3", "5v5"]
 POSITIONS_FULL = ["CF", "LW", "RW", "CM", "GK"]
+TEAM_SIZE = {"1v1": 1, "2v2": 2, "3v3": 3, "5v5": 5}
+# board layout: one row per team, controls underneath
+TEAM_ROW = {"A": 0, "B": 1}
+CONTROL_ROW = 2
+REFRESH_DEBOUNCE_S = 0.25  # batch board edits from rapid clicks
 
 # mommy vibe variants
 MOMMY_DM_START = [
@@ -69,22 +76,81 @@ AD_DESC_VARIANTS = [
 ]
 
 # ------------- helpers -------------
+MODE_CHANNEL_IDS = {"1v1": CH_1V1, "2v2": CH_2V2, "3v3": CH_3V3, "5v5": CH_5V5}
+
 def mode_channel_map(bot: commands.Bot, mode: str):
-    return {
-        "1v1": bot.get_channel(CH_1V1),
-        "2v2": bot.get_channel(CH_2V2),
-        "3v3": bot.get_channel(CH_3V3),
-        "5v5": bot.get_channel(CH_5V5),
-    }.get(mode)
-
-def applicable_positions(mode: str) -> list[str]:
-    if mode == "1v1":
-        return ["CF"]
-    if mode in ("2v2", "3v3"):
-        return ["CF", "LW", "RW", "CM"]
-    return POSITIONS_FULL
+    cid = MODE_CHANNEL_IDS.get(mode)
+    return bot.get_channel(cid) if cid else None
+
+POSITIONS_BY_MODE = {
+    "1v1": ("CF",),
+    "2v2": ("CF", "LW", "RW", "CM"),
+    "3v3": ("CF", "LW", "RW", "CM"),
+    "5v5": tuple(POSITIONS_FULL),
+}
+
+def applicable_positions(mode: str) -> tuple[str, ...]:
+    return POSITIONS_BY_MODE.get(mode, POSITIONS_BY_MODE["5v5"])
+
+async def _dm_players(guild: discord.Guild, uids, text: str):
+    # DM everyone at once; members usually come from cache, and create_dm reuses open channels
+    async def _send(uid: int):
+        try:
+            member = guild.get_member(uid) or await guild.fetch_member(uid)
+            dm = await member.create_dm()
+            await dm.send(text)
+        except Exception:
+            log.debug("couldn't DM %s", uid)
+
+    await asyncio.gather(*(_send(uid) for uid in uids))
+
+def _msg_check(m: discord.Message, *, user_id: int, channel_id: int) -> bool:
+    return m.author.id == user_id and m.channel.id == channel_id
 
 # ------------- compact DM flow -------------
+class DuelSetupView(discord.ui.View):
+    """Region, mode and position on one message, locked in with Confirm."""
+
+    def __init__(self):
+        super().__init__(timeout=120)
+        self.region: str | None = None
+        self.mode: str | None = None
+        self.position: str | None = None
+        self.done = asyncio.Event()
+
+    @discord.ui.select(placeholder="Region…", options=[discord.SelectOption(label=r) for r in REGIONS], row=0)
+    async def pick_region(self, inter: discord.Interaction, select: discord.ui.Select):
+        self.region = select.values[0]
+        await inter.response.defer()
+
+    @discord.ui.select(placeholder="Mode…", options=[discord.SelectOption(label=m) for m in MODES], row=1)
+    async def pick_mode(self, inter: discord.Interaction, select: discord.ui.Select):
+        self.mode = select.values[0]
+        await inter.response.defer()
+
+    @discord.ui.select(placeholder="Position…", options=[discord.SelectOption(label=p) for p in POSITIONS_FULL], row=2)
+    async def pick_position(self, inter: discord.Interaction, select: discord.ui.Select):
+        self.position = select.values[0]
+        await inter.response.defer()
+
+    @discord.ui.button(label="Confirm", style=discord.ButtonStyle.success, emoji="💖", row=3)
+    async def confirm(self, inter: discord.Interaction, _: discord.ui.Button):
+        if not (self.region and self.mode and self.position):
+            await inter.response.send_message("Pick a region, mode **and** position first, sweetie~", ephemeral=True)
+            return
+        allowed = applicable_positions(self.mode)
+        if self.position not in allowed:
+            await inter.response.send_message(
+                f"**{self.position}** isn’t in {self.mode}, darling~ pick one of: {', '.join(allowed)}",
+                ephemeral=True,
+            )
+            return
+        await inter.response.send_message(
+            f"Got it: **{self.region} • {self.mode} • {self.position}**", ephemeral=True
+        )
+        self.done.set()
+        self.stop()
+
 class DMDuelSetup:
     def __init__(self, user: discord.User, bot: commands.Bot, stake_m: int):
         self.user = user
@@ -99,75 +165,53 @@ class DMDuelSetup:
 
     async def run(self) -> tuple[str, str, str, str, str, int] | None:
         dm = await self.user.create_dm()
-        await dm.send(random.choice(MOMMY_DM_START))
-
-        # region
-        await dm.send(random.choice(MOMMY_PICK_REGION))
-        self.region = await self._select_menu([discord.SelectOption(label=r) for r in REGIONS], dm)
-        if not self.region:
-            return None
 
-        # mode
-        await dm.send(random.choice(MOMMY_PICK_MODE))
-        self.mode = await self._select_menu([discord.SelectOption(label=m) for m in MODES], dm)
-        if not self.mode:
+        # region + mode + position in one message
+        view = DuelSetupView()
+        msg = await dm.send(
+            f"{random.choice(MOMMY_DM_START)}\n"
+            f"{random.choice(MOMMY_PICK_REGION)} • {random.choice(MOMMY_PICK_MODE)} • {random.choice(MOMMY_PICK_POS)}\n"
+            "Then hit **Confirm**~",
+            view=view,
+        )
+        try:
+            await asyncio.wait_for(view.done.wait(), timeout=120)
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await msg.edit(view=None)
+        except discord.HTTPException:
+            pass
+        if not view.done.is_set():
             return None
+        self.region, self.mode, self.position = view.region, view.mode, view.position
 
-        # username
-        await dm.send(random.choice(MOMMY_USER_NAME))
-        msg = await self.bot.wait_for(
-            "message",
-            check=lambda m: m.author == self.user and m.channel == dm,
-            timeout=120,
+        # username + optional ps link in one reply
+        await dm.send(
+            f"{random.choice(MOMMY_USER_NAME)}\n"
+            f"{random.choice(MOMMY_PS_LINK)} — put it on the **next line** of the same message."
         )
-        self.username = msg.content.strip()
-
-        # ps link
-        await dm.send(random.choice(MOMMY_PS_LINK))
-        msg = await self.bot.wait_for(
-            "message",
-            check=lambda m: m.author == self.user and m.channel == dm,
-            timeout=120,
-        )
-        self.ps_link = "" if msg.content.strip().lower() == "skip" else msg.content.strip()
-
-        # position
-        await dm.send(random.choice(MOMMY_PICK_POS))
-        opts = [discord.SelectOption(label=p) for p in applicable_positions(self.mode)]
-        self.position = await self._select_menu(opts, dm)
-        if not self.position:
+        try:
+            msg = await self.bot.wait_for(
+                "message",
+                check=functools.partial(_msg_check, user_id=self.user.id, channel_id=dm.id),
+                timeout=120,
+            )
+        except asyncio.TimeoutError:
+            await dm.send("⏰ Timeout – start again with `!anteup`.")
             return None
+        lines = msg.content.strip().split("\n", 1)
+        self.username = lines[0].strip()
+        ps_link = lines[1].strip() if len(lines) > 1 else ""
+        self.ps_link = "" if ps_link.lower() == "skip" else ps_link
 
         await dm.send("💖 All set! Mommy created your ad — check the server!")
         return self.region, self.mode, self.username, self.ps_link, self.position, self.stake
 
-    async def _select_menu(self, options: list[discord.SelectOption], dm: discord.DMChannel) -> str | None:
-        view = discord.ui.View(timeout=120)
-        select = discord.ui.Select(placeholder="Choose…", options=options)
-        view.add_item(select)
-        chosen: str | None = None
-
-        async def cb(inter: discord.Interaction):
-            nonlocal chosen
-            chosen = select.values[0]
-            await inter.response.send_message(f"Got it: **{chosen}**", ephemeral=True)
-
-        select.callback = cb
-        msg = await dm.send(view=view)
-        for _ in range(240):
-            await asyncio.sleep(0.5)
-            if chosen:
-                break
-        try:
-            await msg.edit(view=None)
-        except:
-            pass
-        return chosen
-
 # ------------- sexy grid view -------------
 class PositionButton(discord.ui.Button):
     def __init__(self, team: str, pos: str, mode: str):
-        super().__init__(label=f"{team}:{pos}", style=discord.ButtonStyle.blurple)
+        super().__init__(label=f"{team}:{pos}", style=discord.ButtonStyle.blurple, row=TEAM_ROW[team])
         self.team = team
         self.pos = pos
         self.mode = mode
@@ -176,7 +220,7 @@ class PositionButton(discord.ui.Button):
         board: "TeamBoard" = self.view
         uid = interaction.user.id
 
-        if uid in [u for u, _ in board.teamA + board.teamB]:
+        if uid in board._joined:
             await interaction.response.send_message("You already picked a spot, sweetie~ 💕", ephemeral=True)
             return
 
@@ -185,11 +229,11 @@ class PositionButton(discord.ui.Button):
             await interaction.response.send_message("Team’s full, darling~", ephemeral=True)
             return
 
-        if any(p == self.pos for _, p in tgt):
+        if (self.team, self.pos) in board._taken:
             await interaction.response.send_message("Position taken, cutie~", ephemeral=True)
             return
 
-        tgt.append((uid, self.pos))
+        board._join(self.team, uid, self.pos)
         self.label = f"{interaction.user.display_name}"
         self.style = discord.ButtonStyle.gray
         self.disabled = True
@@ -200,7 +244,7 @@ class PositionButton(discord.ui.Button):
 
 class LeaveButton(discord.ui.Button):
     def __init__(self):
-        super().__init__(label="Leave Position", style=discord.ButtonStyle.danger)
+        super().__init__(label="Leave Position", style=discord.ButtonStyle.danger, row=CONTROL_ROW)
 
     async def callback(self, interaction: discord.Interaction):
         board: "TeamBoard" = self.view
@@ -215,11 +259,7 @@ class LeaveButton(discord.ui.Button):
             await board.cancel_ad(interaction)
             return
 
-        if uid in [u for u, _ in board.teamA]:
-            board.teamA = [(u, p) for u, p in board.teamA if u != uid]
-        elif uid in [u for u, _ in board.teamB]:
-            board.teamB = [(u, p) for u, p in board.teamB if u != uid]
-        else:
+        if not board._leave(uid):
             await interaction.response.send_message("You don't have a position to leave, sweetie~ 💕", ephemeral=True)
             return
 
@@ -237,8 +277,18 @@ class TeamBoard(discord.ui.View):
         self.stake_m = stake_m
         self.teamA: list[tuple[int, str]] = []
         self.teamB: list[tuple[int, str]] = []
-        self.max_per_team = {"1v1": 1, "2v2": 2, "3v3": 3, "5v5": 5}[mode]
+        self.max_per_team = TEAM_SIZE[mode]
         self.message: discord.Message | None = None
+        self._close_handle: asyncio.TimerHandle | None = None
+        self._embed: discord.Embed | None = None
+        # lookups for joins/leaves/refresh; kept in step with teamA/teamB
+        self._joined: set[int] = set()
+        self._taken: dict[tuple[str, str], int] = {}
+        self._refresh_task: asyncio.Task | None = None
+        self._dirty = False
+        self._full_fired = False
+        # the cog's live-board registry, so a closed board can drop itself from it
+        self._registry: OrderedDict[int, TeamBoard] | None = None
         self._build_grid()
         self._start_auto_close()
 
@@ -250,92 +300,137 @@ class TeamBoard(discord.ui.View):
             self.add_item(PositionButton("B", pos, self.mode))
         self.add_item(LeaveButton())
 
+    def _join(self, team: str, uid: int, pos: str):
+        (self.teamA if team == "A" else self.teamB).append((uid, pos))
+        self._joined.add(uid)
+        self._taken[(team, pos)] = uid
+
+    def _leave(self, uid: int) -> bool:
+        if uid not in self._joined:
+            return False
+        self._joined.discard(uid)
+        self._taken = {k: v for k, v in self._taken.items() if v != uid}
+        self.teamA = [(u, p) for u, p in self.teamA if u != uid]
+        self.teamB = [(u, p) for u, p in self.teamB if u != uid]
+        return True
+
     async def cancel_ad(self, interaction: discord.Interaction):
         if not self.message:
             return
+        # stop first so a pending refresh can't re-edit the live board over this
+        self.close()
         try:
             await self.message.edit(content="❌ Ad cancelled by host.", embed=None, view=None)
-        except:
+        except discord.HTTPException:
             pass
-        for uid, _ in self.teamA + self.teamB:
-            try:
-                user = await self.message.guild.fetch_member(uid)
-                dm = await user.create_dm()
-                await dm.send("❌ The wager ad you joined was cancelled by the host.")
-            except:
-                pass
+        await _dm_players(self.message.guild, self._joined, "❌ The wager ad you joined was cancelled by the host.")
         await interaction.response.send_message("Ad cancelled.", ephemeral=True)
+
+    def close(self):
+        """Stop listening and drop the auto-close timer and any pending refresh so the board can be freed."""
+        if self._close_handle:
+            self._close_handle.cancel()
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
         self.stop()
+        if self._registry is not None and self.message:
+            self._registry.pop(self.message.id, None)
 
     def _start_auto_close(self):
-        async def _close():
-            await asyncio.sleep(AUTO_CLOSE_H * 3600)
-            if self.message:
-                try:
-                    await self.message.edit(
-                        content="💤 **Ad expired** – Mommy closed it after 4 hours.",
-                        embed=None,
-                        view=None,
-                    )
-                except:
-                    pass
-        asyncio.create_task(_close())
+        # a timer handle instead of a task parked in sleep() for hours
+        loop = asyncio.get_running_loop()
+        self._close_handle = loop.call_later(AUTO_CLOSE_H * 3600, self._fire_close)
+
+    def _fire_close(self):
+        asyncio.create_task(self._expire())
+
+    async def _expire(self):
+        await self._shut("💤 **Ad expired** – Mommy closed it after 4 hours.")
+
+    async def _shut(self, content: str):
+        # close before editing so a pending refresh can't put the buttons back
+        self.close()
+        if self.message:
+            try:
+                await self.message.edit(content=content, embed=None, view=None)
+            except discord.HTTPException:
+                pass
 
     async def _refresh_embed(self):
+        # clicks landing close together share one edit instead of one each
         if not self.message:
             return
-        try:
-            for item in self.children:
-                if isinstance(item, PositionButton):
-                    # grey out taken
-                    taken = any(
-                        p == item.pos and (
-                            (item.team == "A" and u in [x for x, _ in self.teamA]) or
-                            (item.team == "B" and u in [x for x, _ in self.teamB])
-                        )
-                        for u, p in self.teamA + self.teamB
-                    )
-                    item.disabled = taken
-                    item.style = discord.ButtonStyle.gray if taken else discord.ButtonStyle.blurple
-            await self.message.edit(embed=self._build_embed(), view=self)
-        except:
-            pass
+        self._dirty = True
+        if self._refresh_task and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._flush_refresh())
+
+    async def _flush_refresh(self):
+        # loop again if more clicks came in while the edit was in flight
+        while self._dirty:
+            while self._dirty:
+                self._dirty = False
+                await asyncio.sleep(REFRESH_DEBOUNCE_S)
+            if self.is_finished():
+                # cancelled/expired meanwhile; don't put the buttons back
+                return
+            try:
+                for item in self.children:
+                    if isinstance(item, PositionButton):
+                        # grey out taken
+                        taken = (item.team, item.pos) in self._taken
+                        item.disabled = taken
+                        item.style = discord.ButtonStyle.gray if taken else discord.ButtonStyle.blurple
+                await self.message.edit(embed=self._update_embed(), view=self)
+            except discord.HTTPException:
+                pass
 
     def _build_embed(self) -> discord.Embed:
         title = random.choice(AD_TITLE_VARIANTS)
+        ps = f"**PS Link:** {self.ps_link}\n" if self.ps_link else ""
         desc = (
-            random.choice(AD_DESC_VARIANTS)
-            + f"\n**Mode:** {self.mode} • **Region:** {self.region} • **Stake:** ¥{self.stake_m}M per player\n"
+            f"{random.choice(AD_DESC_VARIANTS)}\n"
+            f"**Mode:** {self.mode} • **Region:** {self.region} • **Stake:** ¥{self.stake_m}M per player\n"
             f"**Creator:** <@{self.creator_id}> • **Username:** {self.username}\n"
-            + (f"**PS Link:** {self.ps_link}\n" if self.ps_link else "")
-            + f"\n{MOMMY_AD_NOTE}"
+            f"{ps}\n{MOMMY_AD_NOTE}"
         )
         emb = discord.Embed(title=title, description=desc, color=discord.Color.gold())
-
-        def fmt(team):
-            return "\n".join(f"<@{uid}> — **{pos}**" for uid, pos in team) or "—"
-
-        emb.add_field(name="Team A", value=fmt(self.teamA), inline=True)
-        emb.add_field(name="Team B", value=fmt(self.teamB), inline=True)
+        emb.add_field(name="Team A", value=self._fmt_team(self.teamA), inline=True)
+        emb.add_field(name="Team B", value=self._fmt_team(self.teamB), inline=True)
         emb.set_footer(text=MOMMY_AD_FOOTER)
+        self._embed = emb
         return emb
 
+    def _update_embed(self) -> discord.Embed:
+        # only the rosters change after posting, so patch those fields in place
+        if self._embed is None:
+            return self._build_embed()
+        self._embed.set_field_at(0, name="Team A", value=self._fmt_team(self.teamA), inline=True)
+        self._embed.set_field_at(1, name="Team B", value=self._fmt_team(self.teamB), inline=True)
+        return self._embed
+
+    @staticmethod
+    def _fmt_team(team: list[tuple[int, str]]) -> str:
+        return "\n".join(f"<@{uid}> — **{pos}**" for uid, pos in team) or "—"
+
     async def _check_full(self):
+        # the last slots on A and B can fill in parallel callbacks; only the first one acts
+        if self._full_fired:
+            return
         if len(self.teamA) == self.max_per_team and len(self.teamB) == self.max_per_team:
-            btn = discord.ui.Button(label="Submit Match Result", style=discord.ButtonStyle.success, emoji="📸")
+            self._full_fired = True
+            btn = discord.ui.Button(label="Submit Match Result", style=discord.ButtonStyle.success, emoji="📸", row=CONTROL_ROW)
             btn.callback = self._open_result_modal
             self.add_item(btn)
             await self._refresh_embed()
-            for uid in {u for u, _ in self.teamA + self.teamB}:
-                try:
-                    user = await self.message.guild.fetch_member(uid)
-                    dm = await user.create_dm()
-                    await dm.send("💋 Match is ready! Play your game, **screenshot the final stats**, then submit results.")
-                except:
-                    pass
+            # DM the players in the background so the last click isn't held up
+            asyncio.create_task(_dm_players(
+                self.message.guild, self._joined,
+                "💋 Match is ready! Play your game, **screenshot the final stats**, then submit results.",
+            ))
 
     async def _open_result_modal(self, interaction: discord.Interaction):
-        if interaction.user.id not in [u for u, _ in self.teamA + self.teamB]:
+        if interaction.user.id not in self._joined:
             await interaction.response.send_message("Only players in this match can submit, sweetie~", ephemeral=True)
             return
         await interaction.response.send_modal(ResultModal(self))
@@ -356,7 +451,11 @@ class ResultModal(discord.ui.Modal, title="Match Result"):
         if not ch:
             await interaction.response.send_message("Mod channel not found.", ephemeral=True)
             return
-        emb = discord.Embed(title="📸 Match Result Awaiting Review", color=discord.Color.blurple())
+        emb = discord.Embed(
+            title="📸 Match Result Awaiting Review",
+            description="Approve = move values. Decline = no change.",
+            color=discord.Color.blurple(),
+        )
         emb.add_field(name="Mode / Region", value=f"{self.board.mode} • {self.board.region}", inline=False)
         emb.add_field(name="Stake", value=f"¥{self.board.stake_m}M per player", inline=False)
         emb.add_field(name="Winner", value=f"Team {winner}", inline=False)
@@ -366,55 +465,131 @@ class ResultModal(discord.ui.Modal, title="Match Result"):
 
         emb.add_field(name="Team A", value=fmt(self.board.teamA), inline=False)
         emb.add_field(name="Team B", value=fmt(self.board.teamB), inline=False)
-        emb.set_footer(text="Approve = move values. Decline = no change.")
-        await ch.send(embed=emb, view=ModApproveView(self.board, winner))
+        # settlement reads its context back from here, so the buttons still work after a restart
+        emb.set_footer(text=_pack_review_ctx(
+            self.board.stake_m, winner,
+            [uid for uid, _ in self.board.teamA], [uid for uid, _ in self.board.teamB],
+        ))
+        await ch.send(embed=emb, view=ModApproveView(self.board))
         await interaction.response.send_message("Proof sent to mods for review. 💖", ephemeral=True)
 
+def _pack_review_ctx(stake_m: int, winner: str, team_a: list[int], team_b: list[int]) -> str:
+    return f"stake={stake_m};winner={winner};teamA={','.join(map(str, team_a))};teamB={','.join(map(str, team_b))}"
+
+def _unpack_review_ctx(msg: discord.Message) -> dict | None:
+    try:
+        if not msg.embeds:
+            return None
+        f = msg.embeds[0].footer.text or ""
+        parts = dict(p.split("=", 1) for p in f.split(";") if "=" in p)
+        for k in ("stake", "winner", "teamA", "teamB"):
+            if k not in parts:
+                return None
+        parts["stake"] = int(parts["stake"])
+        parts["teamA"] = [int(x) for x in parts["teamA"].split(",") if x]
+        parts["teamB"] = [int(x) for x in parts["teamB"].split(",") if x]
+        return parts
+    except Exception:
+        return None
+
 class ModApproveView(discord.ui.View):
-    def __init__(self, board: TeamBoard, winner: str):
+    """Persistent review buttons; the match context lives in the embed footer."""
+    def __init__(self, board: TeamBoard | None = None):
         super().__init__(timeout=None)
         self.board = board
-        self.winner = winner
-
-    @discord.ui.button(label="Approve", style=discord.ButtonStyle.success, emoji="✅")
+        # review messages already being handled; the instance registered at
+        # startup serves every message, so this is per message, not a flag
+        self._claimed: set[int] = set()
+
+    async def _claim(self, inter: discord.Interaction) -> bool:
+        # checked before the first await so a second click can't settle twice
+        if inter.message.id in self._claimed:
+            await inter.response.send_message("This result is already being handled.", ephemeral=True)
+            return False
+        self._claimed.add(inter.message.id)
+        return True
+
+    @discord.ui.button(label="Approve", style=discord.ButtonStyle.success, emoji="✅", custom_id="anteup_approve_result")
     async def approve(self, inter: discord.Interaction, _: discord.ui.Button):
-        await self._settle(inter)
+        if not await self._claim(inter):
+            return
+        ctx = _unpack_review_ctx(inter.message)
+        if not ctx:
+            self._claimed.discard(inter.message.id)
+            await inter.response.send_message("Missing match context.", ephemeral=True)
+            return
+        if await self._settle(inter, ctx):
+            await self._finish(inter)
+        else:
+            # nothing moved, so let a mod try again
+            self._claimed.discard(inter.message.id)
 
-    @discord.ui.button(label="Decline", style=discord.ButtonStyle.danger, emoji="❌")
+    @discord.ui.button(label="Decline", style=discord.ButtonStyle.danger, emoji="❌", custom_id="anteup_decline_result")
     async def decline(self, inter: discord.Interaction, _: discord.ui.Button):
+        if not await self._claim(inter):
+            return
         await inter.response.send_message("❌ Declined – no values moved.", ephemeral=True)
+        await self._finish(inter)
+
+    async def _finish(self, inter: discord.Interaction):
+        # a reviewed result is done: drop the buttons, and free the views bound
+        # to this match. The startup instance has no board and keeps serving
+        # other review messages, so it must not be stopped
+        try:
+            await inter.message.edit(view=None)
+        except discord.HTTPException:
+            pass
+        if self.board:
+            self.stop()
+            self.board.close()
 
-    async def _settle(self, inter: discord.Interaction):
-        winners = self.board.teamA if self.winner == "A" else self.board.teamB
-        losers = self.board.teamB if self.winner == "A" else self.board.teamA
-        stake = int(self.board.stake_m)
+    async def _settle(self, inter: discord.Interaction, ctx: dict) -> bool:
+        team_a, team_b = ctx["teamA"], ctx["teamB"]
+        winners, losers = (team_a, team_b) if ctx["winner"] == "A" else (team_b, team_a)
+        stake = ctx["stake"]
 
         try:
-            # Winners gain stake * opponent count
-            for uid, _ in winners:
-                await data_manager.add_member_value(str(uid), stake * len(losers))
+            ledger = getattr(data_manager, "data_manager", None)
+            if ledger is None:
+                raise RuntimeError("data_manager.data_manager is not initialized")
 
-            # Losers lose stake * opponent count
-            for uid, _ in losers:
-                await data_manager.add_member_value(str(uid), -stake * len(winners))
+            # Winners gain stake * opponent count, losers lose stake * opponent count
+            deltas = {str(uid): stake * len(losers) for uid in winners}
+            deltas.update({str(uid): -stake * len(winners) for uid in losers})
+            await ledger.bulk_adjust(deltas)
 
             await inter.response.send_message("✅ Values updated – winners paid, losers debited.", ephemeral=True)
 
-            for uid, _ in self.board.teamA + self.board.teamB:
-                try:
-                    user = await self.board.message.guild.fetch_member(uid)
-                    dm = await user.create_dm()
-                    await dm.send("✅ Your match result has been approved by the mods!")
-                except:
-                    pass
+            await _dm_players(inter.guild, team_a + team_b, "✅ Your match result has been approved by the mods!")
+            return True
         except Exception as e:
             log.exception("Error updating values in anteup settlement")
             await inter.response.send_message(f"Error updating values: {e}", ephemeral=True)
+            return False
 
 # ------------- cog -------------
 class AnteUp(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.boards: OrderedDict[int, TeamBoard] = OrderedDict()
+        # review buttons must keep working across restarts
+        try:
+            bot.add_view(ModApproveView())
+        except Exception as e:
+            log.debug(f"ModApproveView register: {e}")
+
+    def _register_board(self, message_id: int, board: TeamBoard):
+        # abandoned ads would otherwise sit in discord.py's view store until they time out
+        board._registry = self.boards
+        self.boards[message_id] = board
+        self.boards.move_to_end(message_id)
+        while len(self.boards) > MAX_ACTIVE_BOARDS:
+            _, evicted = self.boards.popitem(last=False)
+            # stop it now, then tell players it's closed rather than leaving dead buttons up
+            evicted.close()
+            asyncio.create_task(evicted._shut(
+                "🔒 **Ad closed** – too many open ads right now. Start a new one with `!anteup`."
+            ))
 
     @commands.guild_only()
     @commands.command(name="anteup")
@@ -441,11 +616,19 @@ class AnteUp(commands.Cog):
                 ps_link=ps_link,
                 stake_m=stake,
             )
-            board.teamA.append((user.id, position))
+            board._join("A", user.id, position)
+            # mark the host's slot before posting so the ad goes out in one send
+            for item in board.children:
+                if isinstance(item, PositionButton) and item.team == "A" and item.pos == position:
+                    item.label = user.display_name
+                    item.style = discord.ButtonStyle.gray
+                    item.disabled = True
+                    break
 
             embed = board._build_embed()
             msg = await ch.send(content=f"<@&{PING_ROLE_ID}>", embed=embed, view=board)
             board.message = msg
+            self._register_board(msg.id, board)
 
         except asyncio.TimeoutError:
             await user.send("⏰ Timeout – start again with `!anteup`.")
@@ -4,17 +4,21 @@ import sqlite3, pathlib, os
 class DBCheck(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        path = os.getenv("SQLITE3_RAILWAY_VOLUME_MOUNT_PATH")
+        self.db = pathlib.Path(path) / "bot.db" if path else ":memory:"
+        # one autocommit connection for the cog's lifetime; WAL is set once here
+        self._con = sqlite3.connect(self.db, timeout=5, check_same_thread=False, isolation_level=None)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute("PRAGMA synchronous=NORMAL")
+
+    def cog_unload(self) -> None:
+        self._con.close()
 
     @commands.command(hidden=True)
     @commands.is_owner()
     async def dbtest(self, ctx: commands.Context) -> None:
-        path = os.getenv("SQLITE3_RAILWAY_VOLUME_MOUNT_PATH")
-        db   = pathlib.Path(path) / "bot.db" if path else ":memory:"
-        con  = sqlite3.connect(db, timeout=5)
-        con.execute("PRAGMA journal_mode=WAL")
-        con.execute("INSERT OR REPLACE INTO members(user_id,value) VALUES ('999999',123)")
-        con.commit()
-        con.close()
+        db = self.db
+        self._con.execute("INSERT OR REPLACE INTO members(user_id,value) VALUES ('999999',123)")
         size = db.stat().st_size if db != ":memory:" else 0
         await ctx.send(f"DB path: `{db}`\nSize: `{size}` bytes")
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 import discord
 from discord.ext import commands
 import random
+import types
+import functools
 
 # ------------- mommy-vibe text -------------
 TITLE_VARIANTS = [
@@ -22,14 +24,15 @@ CATEGORY_VARIANTS = [
 ]
 
 # ------------- real command list -------------
-PUBLIC_CATEGORIES = {
-    "General": ["help", "value", "activity", "rankings"],
-    "Wagers":  ["anteup"],
-    "Fun":     ["spank", "headpat", "spill", "shopping", "tipjar", "confess"]
-}
-HIDE_COMMANDS = {"eval", "getevaluated", "tryoutsresults", "tryoutresults", "match", "matchresult", "matchcancel"}
+# read-only: these feed the precomputed menu content below
+PUBLIC_CATEGORIES = types.MappingProxyType({
+    "General": ("help", "value", "activity", "rankings"),
+    "Wagers":  ("anteup",),
+    "Fun":     ("spank", "headpat", "spill", "shopping", "tipjar", "confess")
+})
+HIDE_COMMANDS = frozenset({"eval", "getevaluated", "tryoutsresults", "tryoutresults", "match", "matchresult", "matchcancel"})
 
-DESCRIPTIONS = {
+DESCRIPTIONS = types.MappingProxyType({
     "help":     "Mommy shows you all the commands~ 💕",
     "value":    "Check your value or someone else’s 💰",
     "activity": "See how active you’ve been 📊",
@@ -41,12 +44,64 @@ DESCRIPTIONS = {
     "shopping": "See Mommy’s purchases 🛍️",
     "tipjar":   "Check Mommy’s special fund 🪙",
     "confess":  "Make Mommy confess her secrets 💋"
-}
+})
 
 # ------------- embed colours -------------
 PINK  = 0xf47fff
 NEON  = 0xff00ff
 
+# ------------- precomputed menu content -------------
+# everything above is static, so the per-category lists and fields are built once here
+CATEGORY_EMOJI = {"General": "📖", "Wagers": "💴", "Fun": "🎀"}
+VISIBLE_COMMANDS = {
+    cat: [c for c in cmds if c not in HIDE_COMMANDS]
+    for cat, cmds in PUBLIC_CATEGORIES.items()
+}
+# (name, value) pairs for `!help <category>`
+CATEGORY_FIELDS = {
+    cat: [(f"**!{c}**  {DESCRIPTIONS.get(c, '—')}", "\u200b") for c in visible]
+    for cat, visible in VISIBLE_COMMANDS.items()
+}
+# (name, value) pairs for the select menu's category page
+SELECT_FIELDS = {
+    cat: [(f"**!{c}**", DESCRIPTIONS.get(c, "—")) for c in visible]
+    for cat, visible in VISIBLE_COMMANDS.items()
+}
+MAIN_MENU_FIELDS = [
+    (f"{CATEGORY_EMOJI.get(cat, '✨')} **{cat}** ({len(visible)} commands)", ", ".join(f"`{c}`" for c in visible))
+    for cat, visible in VISIBLE_COMMANDS.items()
+    if visible
+]
+CATEGORY_OPTIONS = [
+    discord.SelectOption(label=cat, emoji=CATEGORY_EMOJI.get(cat), description=f"Show {cat} commands")
+    for cat in PUBLIC_CATEGORIES
+]
+
+@functools.lru_cache(maxsize=128)
+def resolve_category(category: str) -> str | None:
+    """Map user input like `fun` / `FUN` to its category key, or None."""
+    cat = category.capitalize()
+    return cat if cat in PUBLIC_CATEGORIES else None
+
+class CatView(discord.ui.View):
+    def __init__(self):
+        super().__init__(timeout=60)
+        select = discord.ui.Select(placeholder="Pick a topic…", options=list(CATEGORY_OPTIONS))
+        select.callback = self.on_select
+        self.add_item(select)
+
+    async def on_select(self, interaction: discord.Interaction):
+        cat = interaction.data["values"][0]
+        e = discord.Embed(
+            title=f"💕 {cat} Commands",
+            description=random.choice(CATEGORY_VARIANTS).format(cat=cat),
+            color=NEON
+        )
+        for name, value in SELECT_FIELDS[cat]:
+            e.add_field(name=name, value=value, inline=False)
+        e.set_footer(text="Mommy’s always here if you need more help~ 💖")
+        await interaction.response.edit_message(embed=e, view=self)
+
 class HelpPublic(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -55,9 +110,8 @@ class HelpPublic(commands.Cog):
     async def help_cmd(self, ctx, category: str | None = None):
         """Mommy’s help menu~"""
         if category:
-            cat = category.capitalize()
-            cmds = PUBLIC_CATEGORIES.get(cat)
-            if not cmds:
+            cat = resolve_category(category)
+            if cat is None:
                 embed = discord.Embed(
                     title="😔 Mommy doesn’t know that category…",
                     description=f"Try one of these: {', '.join(PUBLIC_CATEGORIES)}",
@@ -68,14 +122,8 @@ class HelpPublic(commands.Cog):
             title = f"💕 {cat} Commands"
             desc  = random.choice(CATEGORY_VARIANTS).format(cat=cat)
             embed = discord.Embed(title=title, description=desc, color=NEON)
-            for c in cmds:
-                if c in HIDE_COMMANDS:
-                    continue
-                embed.add_field(
-                    name=f"**!{c}**  {DESCRIPTIONS.get(c, '—')}",
-                    value="\u200b",
-                    inline=False
-                )
+            for name, value in CATEGORY_FIELDS[cat]:
+                embed.add_field(name=name, value=value, inline=False)
             embed.set_footer(text="Need more? Ask Mommy anytime~ 💖")
             return await ctx.send(embed=embed)
 
@@ -83,45 +131,11 @@ class HelpPublic(commands.Cog):
         title = random.choice(TITLE_VARIANTS)
         desc  = random.choice(DESC_VARIANTS)
         embed = discord.Embed(title=title, description=desc, color=PINK)
-        for cat, cmds in PUBLIC_CATEGORIES.items():
-            visible = [c for c in cmds if c not in HIDE_COMMANDS]
-            if not visible:
-                continue
-            emoji = {"General": "📖", "Wagers": "💴", "Fun": "🎀"}.get(cat, "✨")
-            embed.add_field(
-                name=f"{emoji} **{cat}** ({len(visible)} commands)",
-                value=", ".join(f"`{c}`" for c in visible),
-                inline=False
-            )
+        for name, value in MAIN_MENU_FIELDS:
+            embed.add_field(name=name, value=value, inline=False)
         embed.set_thumbnail(url=self.bot.user.display_avatar.url)
         embed.set_footer(text="Choose a category below or type !help <category> ~ Mommy’s watching 💕")
 
-        class CatView(discord.ui.View):
-            def __init__(self):
-                super().__init__(timeout=60)
-                opts = [
-                    discord.SelectOption(label=cat, emoji={"General": "📖", "Wagers": "💴", "Fun": "🎀"}.get(cat),
-                                         description=f"Show {cat} commands")
-                    for cat in PUBLIC_CATEGORIES
-                ]
-                select = discord.ui.Select(placeholder="Pick a topic…", options=opts)
-                select.callback = self.on_select
-                self.add_item(select)
-
-            async def on_select(self, interaction: discord.Interaction):
-                cat = interaction.data["values"][0]
-                cmds = PUBLIC_CATEGORIES[cat]
-                visible = [c for c in cmds if c not in HIDE_COMMANDS]
-                e = discord.Embed(
-                    title=f"💕 {cat} Commands",
-                    description=random.choice(CATEGORY_VARIANTS).format(cat=cat),
-                    color=NEON
-                )
-                for c in visible:
-                    e.add_field(name=f"**!{c}**", value=DESCRIPTIONS.get(c, "—"), inline=False)
-                e.set_footer(text="Mommy’s always here if you need more help~ 💖")
-                await interaction.response.edit_message(embed=e, view=self)
-
         await ctx.send(embed=embed, view=CatView())
 
 async def setup(bot):
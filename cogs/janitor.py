@@ -1,5 +1,10 @@
+import logging
+
+import discord
 from discord.ext import commands
 
+log = logging.getLogger(__name__)
+
 class Janitor(commands.Cog):
     """One-off cleanup tools."""
 
@@ -10,18 +15,25 @@ class Janitor(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def cleanup_clanker(self, ctx: commands.Context):
         """Bulk-delete old bot roast spam (one-time use)."""
-        cleaned = 0
-        async for m in ctx.channel.history(limit=200):
-            if (
+        def is_roast(m) -> bool:
+            return (
                 m.author.id == self.bot.user.id
                 and m.reference
                 and "clanker" in m.content.lower()
-            ):
-                try:
-                    await m.delete()
-                    cleaned += 1
-                except: pass
-        await ctx.send(f"🧹 Janitor swept {cleaned} old roast messages.", delete_after=5)
+            )
+
+        # purge uses the bulk-delete endpoint (100 per call) and only
+        # falls back to single deletes for messages older than 14 days
+        try:
+            deleted = await ctx.channel.purge(limit=200, check=is_roast, bulk=True)
+        except discord.Forbidden:
+            await ctx.send("🧹 Janitor can't delete messages here (missing permissions).", delete_after=5)
+            return
+        except discord.HTTPException as e:
+            log.warning(f"cleanupClanker purge failed in #{ctx.channel}: {e}")
+            await ctx.send("🧹 Janitor hit a Discord error mid-sweep – try again shortly.", delete_after=5)
+            return
+        await ctx.send(f"🧹 Janitor swept {len(deleted)} old roast messages.", delete_after=5)
 
 
 async def setup(bot: commands.Bot):
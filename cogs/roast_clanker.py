@@ -1,10 +1,14 @@
 from __future__ import annotations
+import re
+import heapq
 import random
 import asyncio
+import itertools
 import time
 import discord
-from discord.ext import commands
-from typing import Dict, List
+from collections import deque
+from discord.ext import commands, tasks
+from typing import Deque, Dict, List, Tuple
 
 ENABLED = True  # safety switch
 # ---------- scripts ----------
@@ -1499,7 +1503,12 @@ ROAST_SCRIPTS = [  # your 60 full scripts here
 # (paste these into ROAST_SCRIPTS list – you now have 60 full arrays)
 ]
 
-NICE_TRY_VARIANTS = [
+# tuples: immutable, and a bit more compact than lists for big static pools
+ROAST_SCRIPTS = tuple(tuple(script) for script in ROAST_SCRIPTS)
+# each script ready to send as one message
+ROAST_SCRIPTS_JOINED = tuple("\n".join(script) for script in ROAST_SCRIPTS)
+
+NICE_TRY_VARIANTS = (
     "nice try 💅",
     "cope harder 🌸",
     "weak bait 🎀",
@@ -1510,65 +1519,137 @@ NICE_TRY_VARIANTS = [
     "pipe down 📖",
     "stay mad 😴",
     "next joke ⏭️"
-]
+)
+
+# case-insensitive match without lowercasing a copy of every message
+CLANKER_RE = re.compile(r"clanker", re.IGNORECASE)
 
 # ---------- cog ----------
 class RoastClanker(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.user_log: Dict[int, List[float]] = {}       # uid -> timestamps (30-s window)
+        self._rng = random.Random()
+        self.user_log: Dict[int, Deque[float]] = {}      # uid -> timestamps (30-s window), oldest first
         self.nice_try_until: Dict[int, float] = {}      # uid -> unix-seconds when nice-try mode ends
+        # pending auto-deletes: (deadline, tiebreak, message), swept by one background task
+        self._delete_heap: List[Tuple[float, int, discord.Message]] = []
+        self._delete_seq = itertools.count()
+        self._delete_wakeup = asyncio.Event()
+        self._sweeper: asyncio.Task | None = None
+
+    async def cog_load(self):
+        self._sweeper = asyncio.create_task(self._sweep())
+        self._gc.start()
+
+    async def cog_unload(self):
+        if self._sweeper:
+            self._sweeper.cancel()
+        self._gc.cancel()
+
+    # ---------- housekeeping ----------
+    @tasks.loop(minutes=10)
+    async def _gc(self):
+        # forget users whose hit window / nice-try mode has run out, so the
+        # dicts only hold recently active users
+        now = time.time()
+        for uid, hits in list(self.user_log.items()):
+            while hits and now - hits[0] >= 30:
+                hits.popleft()
+            if not hits:
+                del self.user_log[uid]
+        for uid, until in list(self.nice_try_until.items()):
+            if until <= now:
+                del self.nice_try_until[uid]
 
     # ---------- listener ----------
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
-        if not ENABLED or message.author.bot or message.author.id == self.bot.user.id:
+        if not ENABLED or message.author.bot:
             return
-        content = message.content.lower()
-        if "clanker" not in content:
+        if not CLANKER_RE.search(message.content):
             return
 
         uid = message.author.id
         now = time.time()
 
         # 30-second hit log
-        self.user_log.setdefault(uid, [])
-        self.user_log[uid] = [t for t in self.user_log[uid] if now - t < 30]
-        self.user_log[uid].append(now)
+        hits = self.user_log.get(uid)
+        if hits is None:
+            hits = self.user_log[uid] = deque()
+        while hits and now - hits[0] >= 30:
+            hits.popleft()
+        hits.append(now)
 
         # 3+ hits = enter nice-try mode for 5 minutes
-        if len(self.user_log[uid]) >= 3:
-            self.user_log[uid].clear()
+        if len(hits) >= 3:
+            hits.clear()
             self.nice_try_until[uid] = now + 300  # 5 min
-            txt = random.choice(NICE_TRY_VARIANTS)
+            txt = self._rng.choice(NICE_TRY_VARIANTS)
             m = await message.channel.send(txt, reference=message, allowed_mentions=discord.AllowedMentions.none())
-            await self._schedule_delete(m, 3600)  # delete after 1h
+            self._schedule_delete(m, 3600)  # delete after 1h
             return
 
         # still in nice-try mode? single word only
         if self.nice_try_until.get(uid, 0) > now:
-            txt = random.choice(NICE_TRY_VARIANTS)
+            txt = self._rng.choice(NICE_TRY_VARIANTS)
             m = await message.channel.send(txt, reference=message, allowed_mentions=discord.AllowedMentions.none())
-            await self._schedule_delete(m, 3600)
+            self._schedule_delete(m, 3600)
             return
 
         # normal roast
-        script = random.choice(ROAST_SCRIPTS)
-        msgs = []
-        for line in script:
-            async with message.channel.typing():
-                await asyncio.sleep(1)
-            m = await message.channel.send(line, reference=message if not msgs else None,
-                                         allowed_mentions=discord.AllowedMentions.none())
-            msgs.append(m)
-        for m in msgs:
-            await self._schedule_delete(m, 4 * 3600)  # 4h auto-clean
+        text = self._rng.choice(ROAST_SCRIPTS_JOINED)
+        # whole script in one message: one send instead of a typing + send per line;
+        # awaiting typing() fires a single indicator without the keep-alive task
+        await message.channel.typing()
+        await asyncio.sleep(1)
+        m = await message.channel.send(text, reference=message,
+                                       allowed_mentions=discord.AllowedMentions.none())
+        self._schedule_delete(m, 4 * 3600)  # 4h auto-clean
 
     # ---------- auto-delete ----------
-    async def _schedule_delete(self, msg: discord.Message, delay: int):
-        await asyncio.sleep(delay)
-        try: await msg.delete()
-        except: pass
+    def _schedule_delete(self, msg: discord.Message, delay: int):
+        heapq.heappush(self._delete_heap, (time.time() + delay, next(self._delete_seq), msg))
+        self._delete_wakeup.set()
+
+    async def _sweep(self):
+        # sleep until the earliest deadline, or until a sooner one gets scheduled
+        while True:
+            self._delete_wakeup.clear()
+            if not self._delete_heap:
+                await self._delete_wakeup.wait()
+                continue
+            delay = self._delete_heap[0][0] - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._delete_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            due: Dict[int, List[discord.Message]] = {}
+            now = time.time()
+            while self._delete_heap and self._delete_heap[0][0] <= now:
+                _, _, msg = heapq.heappop(self._delete_heap)
+                due.setdefault(msg.channel.id, []).append(msg)
+            for msgs in due.values():
+                await self._delete_batch(msgs)
+
+    async def _delete_batch(self, msgs: List[discord.Message]):
+        channel = msgs[0].channel
+        for i in range(0, len(msgs), 100):
+            chunk = msgs[i:i + 100]
+            try:
+                if len(chunk) == 1:
+                    await chunk[0].delete()
+                else:
+                    await channel.delete_messages(chunk)
+                continue
+            except Exception:
+                pass
+            # bulk delete refused (e.g. one already gone) - fall back to one by one
+            for m in chunk:
+                try: await m.delete()
+                except discord.HTTPException: pass
 
 
 async def setup(bot: commands.Bot):
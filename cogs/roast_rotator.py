@@ -19,7 +19,8 @@ class RoastRotator(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.index = 0
-        self.roast_a = [
+        self._rng = random.Random()
+        self.roast_a = (
             "Bud thinks he can be #1… keep dreaming lil bro 💭",
             "You’re climbing the ranks? That’s cute. Call me when you hit double digits 🍼",
             "Plot-twist: the only thing you’re #1 at is copium consumption 📈😮‍💨",
@@ -73,9 +74,9 @@ class RoastRotator(commands.Cog):
             "You’re the ‘low spec’ version of yourself 🖥️",
             "You’re the ‘beta’ that never became alpha 🐶",
             "You’re the ‘error: skill ceiling reached’ message 📈🚫",
-        ]
+        )
 
-        self.roast_b = [
+        self.roast_b = (
             "Acting tough on Discord? Bro you’re on Wi-Fi, not the streets 📶🚫",
             "You’re so hard… boiled – and still soft in the middle 🥚",
             "Cool story bro, needs a better main character 🎬",
@@ -108,20 +109,16 @@ class RoastRotator(commands.Cog):
             "You’re the ‘cancel download’ button 📥❌",
             "You’re the ‘please update’ notification 🔄",
             "You’re the ‘low graphics’ setting in real life 🎮",
-            "You’re the ‘beta’ that never became alpha 🐶",
-            "You’re the ‘error: evil not found’ message 🚫",
-        ]
+        )
 
-    @tasks.loop(minutes=2)
+    @tasks.loop(seconds=INTERVAL)
     async def roast_cycle(self):
-        guild = self.bot.guilds[0] if self.bot.guilds else None
-        if not guild:
-            return
-
-        channel = guild.get_channel(CHANNEL_ID)
+        # straight id lookup; bot.guilds copies the whole guild list every tick
+        channel = self.bot.get_channel(CHANNEL_ID)
         if not channel:
             log.warning("Roast channel not found")
             return
+        guild = channel.guild
 
         # pick target
         if self.index % 2 == 0:
@@ -130,7 +127,7 @@ class RoastRotator(commands.Cog):
             user_id, roasts = TARGET_B, self.roast_b
 
         member = guild.get_member(user_id)
-        msg = random.choice(roasts)
+        msg = self._rng.choice(roasts)
         await channel.send(f"{member.mention if member else ''}{msg}")
         log.info(f"Roast sent to {channel}: {msg}")
         self.index += 1
@@ -139,6 +136,9 @@ class RoastRotator(commands.Cog):
     async def before_roast(self):
         await self.bot.wait_until_ready()
 
+    async def cog_load(self):
+        self.roast_cycle.start()
+
     def cog_unload(self):
         self.roast_cycle.cancel()
 
@@ -1,17 +1,19 @@
 from __future__ import annotations
 import asyncio
+import functools
+import itertools
 import random
 import logging
 import time
 import traceback
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 import discord
 from discord.ext import commands
 
-# ✅ FIXED IMPORT — pulls the singleton instance created in ValueLedgerCog
-from data_manager import data_manager
+# the singleton instance is created by ValueLedgerCog and attached to the bot
+from data_manager import DataManager
 
 log = logging.getLogger(__name__)
 
@@ -32,7 +34,18 @@ WEIGHTS = {
     "CM": {"defending": 0.40, "dribbling": 0.30, "passing": 0.20, "shooting": 0.10},
     "GK": {"goalkeeping": 0.60, "defending": 0.25, "passing": 0.15}
 }
+# (metric, weight) pairs per position, flattened once for _compute_value;
+# kept in the original summation order so float rounding is unchanged
+WEIGHT_PAIRS = {
+    pos: tuple(
+        (m, w[m])
+        for m in (("goalkeeping", "defending", "passing") if pos == "GK"
+                  else ("shooting", "dribbling", "passing", "defending"))
+    )
+    for pos, w in WEIGHTS.items()
+}
 MIN_VALUE, MAX_VALUE = 15, 100
+ANSWER_FIELD_MAX = 512   # per-answer cap on the evaluator panel
 
 WELCOME_VARIANTS = [
     "🎴 **Welcome to Novera Tryouts!** Big day, {mention}—this could be your rise to #1!",
@@ -47,16 +60,44 @@ INTERVIEW_QS = [
     "What’s your biggest **area to improve** and how will you work on it?",
     "How many **scrims** can you commit to weekly?"
 ]
+# all questions in one DM; answers still come back one message each
+INTERVIEW_PROMPT = "\n".join(f"**Q{i}.** {q}" for i, q in enumerate(INTERVIEW_QS, start=1))
 THANKS_VARIANTS = [
     "Nice—interview recorded. We’ll follow up soon. 💼",
     "Got it. Your answers are locked. 📘",
     "Thanks! The evaluator will score you shortly. 📝"
 ]
+POSITION_PLACEHOLDERS = [
+    "Choose your **position**:", "Select the role you’ll represent:", "Pick your position:"
+]
+ANNOUNCE_VARIANTS = [
+    "💕 Mommy’s proud~ {mention} is now worth **¥{value}M**!",
+    "🌸 Congrats sweetie, your new price tag is **¥{value}M**!",
+    "💖 You're valued at **¥{value}M**!",
+    "🎀 Mommy stamped your forehead: **¥{value}M**!"
+]
+# shuffled once, then cycled: cheaper than a choice() per pick and no
+# variant repeats until the whole list has been used
+_welcome_cycle = itertools.cycle(random.sample(WELCOME_VARIANTS, len(WELCOME_VARIANTS)))
+_thanks_cycle = itertools.cycle(random.sample(THANKS_VARIANTS, len(THANKS_VARIANTS)))
+_placeholder_cycle = itertools.cycle(random.sample(POSITION_PLACEHOLDERS, len(POSITION_PLACEHOLDERS)))
+_announce_cycle = itertools.cycle(random.sample(ANNOUNCE_VARIANTS, len(ANNOUNCE_VARIANTS)))
 # -----------------------------------------------
 
 
+# select options never change, so build them once and share them between views
+POSITION_OPTIONS = [discord.SelectOption(label=p, value=p) for p in POSITIONS]
+
+
+def clip(text: str, width: int = ANSWER_FIELD_MAX) -> str:
+    """Trim text to width chars, ending in "..." when cut; line breaks are kept."""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
 def has_role(member: discord.Member, role_id: int) -> bool:
-    return any(r.id == role_id for r in member.roles)
+    # Member.get_role checks the sorted role-id array directly instead of
+    # building the member.roles list and scanning it
+    return member.get_role(role_id) is not None
 
 
 @dataclass
@@ -71,91 +112,96 @@ class TryoutInterview:
 
 class PositionSelect(discord.ui.Select):
     def __init__(self):
-        opts = [discord.SelectOption(label=p, value=p) for p in POSITIONS]
         super().__init__(
-            placeholder=random.choice(
-                ["Choose your **position**:", "Select the role you’ll represent:", "Pick your position:"]
-            ),
-            min_values=1, max_values=1, options=opts
+            placeholder=next(_placeholder_cycle),
+            min_values=1, max_values=1, options=list(POSITION_OPTIONS)
         )
         self.choice: Optional[str] = None
+        self.done = asyncio.Event()
 
     async def callback(self, interaction: discord.Interaction):
         self.choice = self.values[0]
+        self.done.set()
         await interaction.response.send_message(f"Position set: **{self.choice}**", ephemeral=True)
 
 
-class RatingSelect(discord.ui.Select):
-    def __init__(self, label: str, row: int = 0):
-        options = [discord.SelectOption(label=str(i), value=str(i)) for i in range(1, 11)]
-        super().__init__(placeholder=f"{label} (1–10)", min_values=1, max_values=1, options=options, row=row)
-        self.metric = label.lower()
-        self.score: Optional[int] = None
+class RatingsModal(discord.ui.Modal, title="Tryout Ratings"):
+    def __init__(self, metrics: List[str], on_done):
+        super().__init__()
+        self.on_done = on_done
+        self.inputs: Dict[str, discord.ui.TextInput] = {}
+        for label in metrics:
+            field = discord.ui.TextInput(label=f"{label} (1–10)", placeholder="1-10", min_length=1, max_length=2)
+            self.add_item(field)
+            self.inputs[label.lower()] = field
 
-    async def callback(self, interaction: discord.Interaction):
-        self.score = int(self.values[0])
-        await interaction.response.send_message(f"{self.metric.capitalize()} = **{self.score}**", ephemeral=True)
+    async def on_submit(self, interaction: discord.Interaction):
+        try:
+            payload = {}
+            for metric, field in self.inputs.items():
+                raw = field.value.strip()
+                if not raw.isdigit() or not 1 <= int(raw) <= 10:
+                    await interaction.response.send_message(
+                        f"{metric.capitalize()} must be a whole number from 1 to 10.", ephemeral=True
+                    )
+                    return
+                payload[metric] = int(raw)
+
+            # saving takes a few requests; only confirm once it has actually worked
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            if await self.on_done(payload):
+                await interaction.followup.send("Submitted. ✅", ephemeral=True)
+            else:
+                await interaction.followup.send("These ratings were already submitted.", ephemeral=True)
+
+        except Exception as e:
+            log.error(f"Error in ratings submit: {e}\n{traceback.format_exc()}")
+            msg = "Error saving the ratings – press **Open Ratings** to try again."
+            if interaction.response.is_done():
+                await interaction.followup.send(msg, ephemeral=True)
+            else:
+                await interaction.response.send_message(msg, ephemeral=True)
 
 
 class EvaluatorView(discord.ui.View):
-    def __init__(self, position: str, on_submit):
+    """One button that opens a ratings modal: a single submit instead of one select per metric."""
+    def __init__(self, position: str, on_submit, on_end):
         super().__init__(timeout=600)
         self.on_submit = on_submit
-        
-        # selects
-        self.sel_shoot = None
-        self.sel_pass = None
-        self.sel_def = None
-        self.sel_drib = None
-        self.sel_gk = None
-
+        # ends the tryout session; called once, on a saved submit or on timeout
+        self.on_end = on_end
+        # set while a submission is saving or once one has saved
+        self._submitted = False
         if position == "GK":
-            self.sel_gk = RatingSelect("Goalkeeping", row=0)
-            self.sel_def = RatingSelect("Defending", row=1)
-            self.sel_pass = RatingSelect("Passing", row=2)
-            self.add_item(self.sel_gk)
-            self.add_item(self.sel_def)
-            self.add_item(self.sel_pass)
-            button_row = 3
+            self.metrics = ["Goalkeeping", "Defending", "Passing"]
         else:
-            self.sel_shoot = RatingSelect("Shooting", row=0)
-            self.sel_drib = RatingSelect("Dribbling", row=1)
-            self.sel_pass = RatingSelect("Passing", row=2)
-            self.sel_def = RatingSelect("Defending", row=3)
-            self.add_item(self.sel_shoot)
-            self.add_item(self.sel_drib)
-            self.add_item(self.sel_pass)
-            self.add_item(self.sel_def)
-            button_row = 4
-
-        button = discord.ui.Button(
-            label="Submit Ratings",
-            style=discord.ButtonStyle.success,
-            row=button_row
-        )
-        button.callback = self._submit
-        self.add_item(button)
+            self.metrics = ["Shooting", "Dribbling", "Passing", "Defending"]
 
-    async def _submit(self, interaction: discord.Interaction):
-        try:
-            if self.sel_gk is not None:
-                need = [self.sel_gk, self.sel_def, self.sel_pass]
-            else:
-                need = [self.sel_shoot, self.sel_drib, self.sel_pass, self.sel_def]
+        button = discord.ui.Button(label="Open Ratings", style=discord.ButtonStyle.success)
+        button.callback = self._open
+        self.add_item(button)
 
-            missing = [s.metric for s in need if s.score is None]
-            if missing:
-                await interaction.response.send_message(f"Missing: {', '.join(missing)}", ephemeral=True)
-                return
+    async def _open(self, interaction: discord.Interaction):
+        await interaction.response.send_modal(RatingsModal(self.metrics, self._done))
 
-            payload = {s.metric: s.score for s in need}
-            
-            await interaction.response.send_message("Submitted. ✅", ephemeral=True)
+    async def _done(self, payload: Dict[str, int]) -> bool:
+        # checked before the first await: a second open modal must not save again
+        if self._submitted:
+            return False
+        self._submitted = True
+        try:
             await self.on_submit(payload)
+        except Exception:
+            # nothing was confirmed, so leave the button live for a retry
+            self._submitted = False
+            raise
+        self.stop()
+        self.on_end()
+        return True
 
-        except Exception as e:
-            log.error(f"Error in _submit: {e}\n{traceback.format_exc()}")
-            await interaction.response.send_message("Error processing submission.", ephemeral=True)
+    async def on_timeout(self):
+        # the evaluator never submitted; don't leave the session behind
+        self.on_end()
 
 
 def mommy_embed(title: str, description: str, user: discord.Member) -> discord.Embed:
@@ -166,13 +212,36 @@ def mommy_embed(title: str, description: str, user: discord.Member) -> discord.E
     return emb
 
 
+@functools.lru_cache(maxsize=4096)
+def compute_value(pos: str, goalkeeping: Optional[int], shooting: Optional[int],
+                  dribbling: Optional[int], passing: Optional[int], defending: Optional[int]) -> int:
+    """Pure rating -> value mapping; only 10^4 score combos per position, so results are cached."""
+    s = {"goalkeeping": goalkeeping, "shooting": shooting, "dribbling": dribbling,
+         "passing": passing, "defending": defending}
+    raw = 0.0
+    for metric, weight in WEIGHT_PAIRS.get(pos, WEIGHT_PAIRS["CF"]):
+        v = s[metric]
+        raw += (5 if v is None else max(1, min(10, int(v)))) * weight
+
+    val = int(round(raw * 10))
+    return max(MIN_VALUE, min(MAX_VALUE, val))
+
+
 class Tryouts(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.sessions: Dict[str, TryoutInterview] = {}
+        # (guild_id, candidate_id) -> session
+        self.sessions: Dict[Tuple[int, int], TryoutInterview] = {}
+
+    def _end_session(self, key: Tuple[int, int], sess: TryoutInterview):
+        # only drop our own session; a newer tryout for the same candidate may own the key
+        if self.sessions.get(key) is sess:
+            del self.sessions[key]
 
-    def _key(self, gid: int, uid: int) -> str:
-        return f"{gid}-{uid}"
+    def _dm(self) -> Optional[DataManager]:
+        # read from the bot each time (one attribute lookup) so a reloaded
+        # ledger cog's new instance is picked up
+        return getattr(self.bot, "data_manager", None)
 
     # -------------------- COMMAND --------------------
     @commands.guild_only()
@@ -194,87 +263,94 @@ class Tryouts(commands.Cog):
         except:
             pass
 
+        key = (ctx.guild.id, member.id)
         sess = TryoutInterview(ctx.guild.id, member.id, ctx.author.id)
-        self.sessions[self._key(ctx.guild.id, member.id)] = sess
+        self.sessions[key] = sess
+        end_session = functools.partial(self._end_session, key, sess)
 
-        # CANDIDATE DM
+        # every path that doesn't hand the session to the evaluator panel
+        # ends it in the finally below; after that the panel owns it
+        handed_off = False
         try:
-            dm = await member.create_dm()
-            await dm.send(random.choice(WELCOME_VARIANTS).format(mention=member.mention))
-            v = discord.ui.View(timeout=300)
-            sel = PositionSelect()
-            v.add_item(sel)
-            pos_msg = await dm.send("—", view=v)
-            for _ in range(600):
-                await asyncio.sleep(0.5)
-                if sel.choice:
-                    sess.position = sel.choice
-                    break
+            # CANDIDATE DM
             try:
-                await pos_msg.edit(view=None)
-            except:
-                pass
-
-            if not sess.position:
-                await dm.send("Tryout cancelled.")
-                await ctx.reply("Candidate did not select a position.", mention_author=False)
-                self.sessions.pop(self._key(ctx.guild.id, member.id), None)
-                return
+                dm = await member.create_dm()
+                await dm.send(next(_welcome_cycle).format(mention=member.mention))
+                v = discord.ui.View(timeout=300)
+                sel = PositionSelect()
+                v.add_item(sel)
+                pos_msg = await dm.send("—", view=v)
+                # wake as soon as they pick instead of polling
+                try:
+                    await asyncio.wait_for(sel.done.wait(), timeout=300)
+                    sess.position = sel.choice
+                except asyncio.TimeoutError:
+                    pass
+                try:
+                    await pos_msg.edit(view=None)
+                except:
+                    pass
+
+                if not sess.position:
+                    await dm.send("Tryout cancelled.")
+                    await ctx.reply("Candidate did not select a position.", mention_author=False)
+                    return
 
-            await dm.send("Answer these questions:")
+                await dm.send(f"Answer these questions — one message per answer, in order:\n{INTERVIEW_PROMPT}")
 
-            for idx, q in enumerate(INTERVIEW_QS, start=1):
-                await dm.send(f"**Q{idx}.** {q}")
+                cand_id, dm_id = member.id, dm.id
 
                 def check(m):
-                    return m.author.id == member.id and m.channel.id == dm.id
+                    return m.author.id == cand_id and m.channel.id == dm_id
 
-                try:
-                    msg = await self.bot.wait_for("message", timeout=240, check=check)
-                    sess.answers.append(msg.content.strip())
-                except asyncio.TimeoutError:
-                    await dm.send("Timeout. Cancelled.")
-                    await ctx.reply("Candidate timed out.", mention_author=False)
-                    self.sessions.pop(self._key(ctx.guild.id, member.id), None)
-                    return
+                for _ in INTERVIEW_QS:
+                    try:
+                        msg = await self.bot.wait_for("message", timeout=240, check=check)
+                        sess.answers.append(msg.content.strip())
+                    except asyncio.TimeoutError:
+                        await dm.send("Timeout. Cancelled.")
+                        await ctx.reply("Candidate timed out.", mention_author=False)
+                        return
 
-            await dm.send(random.choice(THANKS_VARIANTS))
+                await dm.send(next(_thanks_cycle))
 
-        except discord.Forbidden:
-            await ctx.reply("Candidate has DMs disabled.", mention_author=False)
-            self.sessions.pop(self._key(ctx.guild.id, member.id), None)
-            return
+            except discord.Forbidden:
+                await ctx.reply("Candidate has DMs disabled.", mention_author=False)
+                return
 
-        # EVALUATOR PANEL
-        try:
-            eval_dm = await ctx.author.create_dm()
-        except discord.Forbidden:
-            await ctx.reply("Evaluator DMs disabled.", mention_author=False)
-            return
+            # EVALUATOR PANEL
+            try:
+                eval_dm = await ctx.author.create_dm()
+            except discord.Forbidden:
+                await ctx.reply("Evaluator DMs disabled.", mention_author=False)
+                return
 
-        try:
             emb = discord.Embed(
                 title="🧪 Novera Tryout Evaluator Panel",
                 description=f"Candidate: {member.mention}\nPosition: **{sess.position}**",
                 color=discord.Color.blurple()
             )
             for i, q in enumerate(INTERVIEW_QS, start=1):
-                ans = sess.answers[i-1]
-                display = ans if len(ans) <= 512 else ans[:509] + "..."
-                emb.add_field(name=f"Q{i}. {q}", value=display, inline=False)
+                emb.add_field(name=f"Q{i}. {q}", value=clip(sess.answers[i-1]), inline=False)
 
             async def on_submit(scores):
                 value_m = self._compute_value(sess.position, scores)
 
+                ledger = self._dm()
+                if ledger is None:
+                    raise RuntimeError("bot.data_manager is not initialized")
                 uid = str(member.id)
-                data_manager.ensure_member(uid)
-                await data_manager.set_member_value(uid, value_m)
+                ledger.ensure_member(uid)
+                await ledger.set_member_value(uid, value_m)
 
+                # the role, results post, announcement and candidate DM are
+                # independent, so they go out together
+                sends = []
                 role_ok = ctx.guild.get_role(EVALUATED_ROLE_ID)
                 if role_ok:
                     mem = ctx.guild.get_member(member.id)
                     if mem and role_ok not in mem.roles:
-                        await mem.add_roles(role_ok)
+                        sends.append(mem.add_roles(role_ok))
 
                 results_ch = self.bot.get_channel(RESULTS_CHANNEL_ID)
                 if results_ch:
@@ -289,51 +365,40 @@ class Tryouts(commands.Cog):
                     emb2.add_field(name="💰 Final valuation", value=f"**¥{value_m:,}M**")
                     if member.avatar:
                         emb2.set_thumbnail(url=member.avatar.url)
-                    await results_ch.send(embed=emb2)
+                    sends.append(results_ch.send(embed=emb2))
 
                 ann = self.bot.get_channel(ANNOUNCE_CHANNEL_ID)
                 if ann:
-                    msg = random.choice([
-                        f"💕 Mommy’s proud~ {member.mention} is now worth **¥{value_m:,}M**!",
-                        f"🌸 Congrats sweetie, your new price tag is **¥{value_m:,}M**!",
-                        f"💖 You're valued at **¥{value_m:,}M**!",
-                        f"🎀 Mommy stamped your forehead: **¥{value_m:,}M**!"
-                    ])
-                    await ann.send(msg)
+                    msg = next(_announce_cycle).format(mention=member.mention, value=f"{value_m:,}")
+                    sends.append(ann.send(msg))
 
-                try:
-                    dm = await member.create_dm()
-                    await dm.send(f"Your Novera value has been set to **¥{value_m:,}M**!")
-                except:
-                    pass
+                # reuse the candidate's DM channel from the interview
+                sends.append(dm.send(f"Your Novera value has been set to **¥{value_m:,}M**!"))
 
-                self.sessions.pop(self._key(ctx.guild.id, member.id), None)
+                for result in await asyncio.gather(*sends, return_exceptions=True):
+                    if isinstance(result, Exception):
+                        log.warning(f"Tryout result notification failed: {result}")
 
-            view = EvaluatorView(sess.position, on_submit)
+            view = EvaluatorView(sess.position, on_submit, end_session)
             await eval_dm.send(embed=emb, view=view)
+            handed_off = True
 
         except Exception as e:
-            log.error(f"Evaluator panel error: {e}")
-            await ctx.reply("Error opening evaluator panel.", mention_author=False)
+            log.error(f"Tryout error: {e}\n{traceback.format_exc()}")
+            await ctx.reply("Error running the tryout.", mention_author=False)
             return
+        finally:
+            if not handed_off:
+                end_session()
 
         await ctx.reply(f"Tryout started for {member.mention}. Evaluator panel sent.", mention_author=False)
 
     # ---------------- VALUE CALC ------------------
     def _compute_value(self, pos: str, s: Dict[str, int]) -> int:
-        def g(k): return max(1, min(10, int(s.get(k, 5))))
-        w = WEIGHTS.get(pos, WEIGHTS["CF"])
-
-        if pos == "GK":
-            raw = g("goalkeeping")*w["goalkeeping"] + g("defending")*w["defending"] + g("passing")*w["passing"]
-        else:
-            raw = (g("shooting")*w["shooting"] +
-                   g("dribbling")*w["dribbling"] +
-                   g("passing")*w["passing"] +
-                   g("defending")*w["defending"])
-
-        val = int(round(raw * 10))
-        return max(MIN_VALUE, min(MAX_VALUE, val))
+        return compute_value(
+            pos, s.get("goalkeeping"), s.get("shooting"), s.get("dribbling"),
+            s.get("passing"), s.get("defending"),
+        )
 
 
 async def setup(bot):
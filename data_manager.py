@@ -32,11 +32,13 @@ class DataManager:
         async for msg in ch.history(limit=None, oldest_first=False):
             if msg.author.bot is False:
                 continue
-            m = LEDGER_REGEX.match(msg.content)
-            if not m:
-                continue
-            uid, val = m.groups()
-            self._cache[uid] = int(val)
+            # batched writes put one "uid value" pair per line
+            for line in msg.content.splitlines():
+                m = LEDGER_REGEX.match(line)
+                if not m:
+                    continue
+                uid, val = m.groups()
+                self._cache[uid] = int(val)
         logger.info(f"[VALUE-LEDGER] Rebuild complete — {len(self._cache)} members loaded")
 
     async def _log(self, user_id: str, value: int) -> None:
@@ -44,6 +46,21 @@ class DataManager:
         if ch:
             await ch.send(f"{user_id} {value}")
 
+    async def _log_many(self, values: Dict[str, int]) -> None:
+        ch = self.bot.get_channel(LEDGER_CH_ID)
+        if not ch:
+            return
+        # one ledger message per batch, split only to stay under Discord's 2000 char cap
+        chunk = ""
+        for user_id, value in values.items():
+            line = f"{user_id} {value}"
+            if chunk and len(chunk) + len(line) + 1 > 2000:
+                await ch.send(chunk)
+                chunk = ""
+            chunk = f"{chunk}\n{line}" if chunk else line
+        if chunk:
+            await ch.send(chunk)
+
     def ensure_member(self, user_id: str) -> None:
         self._cache.setdefault(user_id, 0)
 
@@ -61,6 +78,15 @@ class DataManager:
         await self._log(user_id, new_val)
         return new_val
 
+    async def bulk_adjust(self, deltas: Dict[str, int], floor: int = 0) -> Dict[str, int]:
+        new_values = {
+            user_id: max(floor, self._cache.get(user_id, 0) + int(delta))
+            for user_id, delta in deltas.items()
+        }
+        self._cache.update(new_values)
+        await self._log_many(new_values)
+        return new_values
+
     def get_all_member_values(self) -> Dict[str, int]:
         return self._cache.copy()
 
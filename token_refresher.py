@@ -30,6 +30,8 @@ logger = logging.getLogger("token_refresher")
 # Token cache file
 TOKEN_CACHE_FILE = "token_cache.json"
 REFRESH_HISTORY_FILE = "token_refresh_history.log"
+# Lets check_auth_errors.py see we're running without scanning the process table
+PID_FILE = "token_refresher.pid"
 
 def validate_token(token):
     """Validate that a token has the correct format and length"""
@@ -207,9 +209,18 @@ def main():
     
     logger.info("Discord Token Refresher started")
     
-    # Check if forced refresh requested
-    if args.force or check_for_refresh_signal():
-        force_refresh()
+    with open(PID_FILE, 'w') as f:
+        f.write(str(os.getpid()))
+    
+    try:
+        # Check if forced refresh requested
+        if args.force or check_for_refresh_signal():
+            force_refresh()
+    finally:
+        try:
+            os.remove(PID_FILE)
+        except OSError:
+            pass
     
 if __name__ == "__main__":
     main()
\ No newline at end of file